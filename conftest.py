@@ -1,112 +1,185 @@
 from __future__ import annotations
 
+import json
 import logging
-import os
 import re
-from dataclasses import dataclass
+import warnings
 from pathlib import Path
-from urllib.parse import urlparse
 
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from tests.config import DEFAULT_LOG_DIR, DEFAULT_TRACE, TestConfig, load_config
+from tests.constants import VISUAL_BASELINE_DIR
+from tests.pages.tabs import Tabs
+from tests.utils import console, memory, network, perf, smoke
+from tests.utils.browser import chrome_options, new_browser
+from tests.utils.commands import add_command_listener
+from tests.utils.logging import (
+    LOG_DATE_FORMAT,
+    LOG_FORMAT,
+    LOGGER_NAME,
+    configure_logging,
+    set_current_test,
+    shutdown_logging,
+    worker_id,
+)
+from tests.utils.matrix import MatrixResults, Target, matrix_targets
+from tests.utils.network import NetworkTrace, enable_performance_logging
+from tests.utils.pool import BrowserPool, PooledBrowser
+from tests.utils.readiness import AppNotReadyError, ReadinessProbe
+from tests.utils.recorder import CommandRecorder
+from tests.utils.result_cache import ResultCache, app_build_id
+from tests.utils.retries import LEDGER as RETRY_LEDGER
+from tests.utils.seed_store import MUTATES_SEED_MARKER, SeedStore
+from tests.utils.timeouts import HISTORY as TIMEOUT_HISTORY
+from tests.utils.tracing import TRACER, merge_traces
+from tests.utils.waits import STATS as WAIT_STATS
+
+pytest_plugins = ["tests.utils.startup"]
+
+MATRIX_RESULTS = MatrixResults()
+MEMORY_REPORT = memory.MemoryReport()
+RESULT_CACHE = ResultCache(
+    DEFAULT_LOG_DIR / ".result-cache.json",
+    Path(__file__).read_text(encoding="utf-8"),
+    inputs=[Path(VISUAL_BASELINE_DIR)],
+)
 
-LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-LOG_DATE_FORMAT = "%H:%M:%S"
-LOGGER_NAME = "hexlet.kanban"
 
-DEFAULT_HEADLESS = os.getenv("HEADLESS", "true").lower() not in {"false", "0", "no"}
-DEFAULT_WINDOW_SIZE = os.getenv("BROWSER_WINDOW_SIZE", "1440,900")
-DEFAULT_PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "45"))
-DEFAULT_IMPLICIT_WAIT = float(os.getenv("SELENIUM_IMPLICIT_WAIT", "0.2"))
-DEFAULT_LOG_LEVEL = os.getenv("TEST_LOG_LEVEL", "INFO").upper()
-DEFAULT_LOG_DIR = Path(os.getenv("TEST_LOG_DIR", "test-results")).resolve()
-
-
-@dataclass(frozen=True, slots=True)
-class TestConfig:
-    implementation: str | None
-    base_url: str
-    log_level: str
-    log_dir: Path
-    screenshots_dir: Path
-    headless: bool
-    window_size: str
-    page_load_timeout: int
-    implicit_wait: float
-
-
-def configure_logging(level: str, log_dir: Path | None = None) -> logging.Logger:
-    logger = logging.getLogger(LOGGER_NAME)
+def _ensure_basic_logging(level: str) -> None:
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
-    if logger.handlers:
-        logger.setLevel(level)
-        return logger
 
-    logger.setLevel(level)
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--full-run",
+        action="store_true",
+        default=False,
+        help="run every test, even those whose passing result could be reused",
+    )
+    parser.addoption(
+        "--smoke-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="run only the most valuable tests that fit this wall-clock budget, at least one per area",
+    )
 
-    if log_dir:
-        log_dir.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_dir / "pytest.log", mode="w", encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
-        file_handler.setLevel(level)
-        logger.addHandler(file_handler)
 
-    return logger
+def pytest_configure(config: pytest.Config) -> None:
+    if DEFAULT_TRACE:
+        TRACER.start(worker_id())
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests of one matrix target on the same xdist worker",
+    )
+    config.addinivalue_line(
+        "markers",
+        f"{MUTATES_SEED_MARKER}: the test changes shared seed data, rebuild it afterwards (SEED_SCOPE=module)",
+    )
 
-def load_config() -> TestConfig:
-    implementation = os.getenv("IMPLEMENTATION")
 
-    if implementation:
-        base_url = f"http://{implementation}.test"
-        os.environ["APP_BASE_URL"] = base_url
-        descriptor = implementation
-    else:
-        base_url = os.getenv("APP_BASE_URL")
-        if not base_url:
-            message = (
-                "APP_BASE_URL is not set. "
-                "For local runs provide APP_BASE_URL (e.g. http://127.0.0.1:5173) "
-                "or use IMPLEMENTATION for prebuilt fixtures."
-            )
-            raise RuntimeError(message)
-        parsed = urlparse(base_url)
-        descriptor = parsed.hostname or "custom"
-
-    log_dir = DEFAULT_LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    screenshots_dir = log_dir / "screenshots" / descriptor
-    screenshots_dir.mkdir(parents=True, exist_ok=True)
-
-    return TestConfig(
-        implementation=implementation,
-        base_url=base_url,
-        log_level=DEFAULT_LOG_LEVEL,
-        log_dir=log_dir,
-        screenshots_dir=screenshots_dir,
-        headless=DEFAULT_HEADLESS,
-        window_size=DEFAULT_WINDOW_SIZE,
-        page_load_timeout=DEFAULT_PAGE_LOAD_TIMEOUT,
-        implicit_wait=DEFAULT_IMPLICIT_WAIT,
-    )
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "target" not in metafunc.fixturenames:
+        return
+    targets = matrix_targets()
+    if targets:
+        metafunc.parametrize(
+            "target",
+            targets,
+            indirect=True,
+            scope="session",
+            ids=[target.name for target in targets],
+        )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    for item in items:
+        target = _item_target(item)
+        if target is not None:
+            # With ``-n N --dist loadgroup`` every target runs in its own worker lane.
+            item.add_marker(pytest.mark.xdist_group(target.name))
+
+    budget = config.getoption("smoke_budget")
+    if budget is not None:
+        _apply_smoke_budget(config, items, budget)
+    if not config.option.collectonly:
+        _apply_result_cache(config, items, reuse=not config.getoption("full_run"))
+
+
+def _apply_smoke_budget(config: pytest.Config, items: list[pytest.Item], budget: float) -> None:
+    smoke_plan = smoke.plan(smoke.candidates([item.nodeid for item in items], smoke.HISTORY), budget)
+    selected = {candidate.nodeid for candidate in smoke_plan.selected}
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.section("smoke plan")
+        for line in smoke_plan.format():
+            reporter.write_line(line)
+
+
+def _apply_result_cache(config: pytest.Config, items: list[pytest.Item], *, reuse: bool) -> None:
+    build_id = app_build_id()
+    if build_id is None:
+        # Without a build identifier a cached pass says nothing about the app.
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None and reuse:
+            reporter.write_line("APP_BUILD_ID is not set: passing results are not reused")
+        return
+    configs: dict[str | None, TestConfig | None] = {}
+    for item in items:
+        target = _item_target(item)
+        key = target.name if target else None
+        if key not in configs:
+            try:
+                configs[key] = load_config(target)
+            except RuntimeError:
+                configs[key] = None
+        test_config = configs[key]
+        if test_config is None:
+            continue
+
+        fingerprint = RESULT_CACHE.fingerprint(item.nodeid, item.module, test_config, build_id)
+        RESULT_CACHE.fingerprints[item.nodeid] = fingerprint
+        if reuse and RESULT_CACHE.is_reusable(item.nodeid, fingerprint):
+            RESULT_CACHE.reused.append(item.nodeid)
+            item.add_marker(pytest.mark.skip(reason="passed before with the same fingerprint"))
+
+
+def _item_target(item: pytest.Item) -> Target | None:
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("target") if callspec else None
 
 
-def _ensure_basic_logging(level: str) -> None:
-    root = logging.getLogger()
-    if not root.handlers:
-        logging.basicConfig(level=level, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+@pytest.fixture(scope="session")
+def target(request: pytest.FixtureRequest) -> Target | None:
+    """The matrix target of this part of the session, ``None`` outside matrix mode."""
+    return getattr(request, "param", None)
 
 
 @pytest.fixture(scope="session")
-def test_config() -> TestConfig:
-    return load_config()
+def test_config(target: Target | None) -> TestConfig:
+    return load_config(target)
 
 
 @pytest.fixture(scope="session")
 def test_logger(test_config: TestConfig) -> logging.Logger:
     _ensure_basic_logging(test_config.log_level)
-    logger = configure_logging(test_config.log_level, test_config.log_dir)
+    logger = configure_logging(
+        test_config.log_level,
+        test_config.log_dir,
+        use_queue=test_config.log_queue,
+        json_lines=test_config.log_json,
+        max_bytes=test_config.log_max_bytes,
+        backup_count=test_config.log_backups,
+    )
     logging.captureWarnings(True)
     logger.info(
         "Logging initialised (implementation=%s, base_url=%s, log_dir=%s)",
@@ -117,22 +190,72 @@ def test_logger(test_config: TestConfig) -> logging.Logger:
     return logger
 
 
+@pytest.fixture(scope="session")
+def perf_monitor(test_config: TestConfig, test_logger: logging.Logger):
+    if test_config.perf_budget_mode == "off":
+        yield None
+        return
+
+    monitor = perf.PerfMonitor(perf.load_budgets(test_config.perf_budgets_file), test_config.perf_budget_mode)
+    yield monitor
+    trend_dir = test_config.log_dir / "perf"
+    if test_config.matrix:
+        trend_dir = trend_dir / test_config.target
+    monitor.write_trend(trend_dir)
+    test_logger.info("Wrote performance trend for %d routes to %s", len(monitor.samples), trend_dir)
+
+
+def _check_perf_budgets(item: pytest.Item, report: pytest.TestReport) -> None:
+    """Turn budget violations of a passing call into its failure (``fail``) or a warning."""
+    monitor = getattr(item, "perf_monitor", None)
+    if monitor is None or not monitor.violations:
+        return
+
+    message = f"Performance budget exceeded in {item.nodeid}:\n" + "\n".join(monitor.violations)
+    if monitor.mode == "fail":
+        report.outcome = "failed"
+        report.longrepr = message
+        return
+    logging.getLogger(LOGGER_NAME).warning(message)
+    warnings.warn(message, stacklevel=1)
+
+
 @pytest.fixture(scope="session")
 def base_url(test_config: TestConfig) -> str:
     return test_config.base_url
 
 
+@pytest.fixture(scope="session")
+def app_ready(test_config: TestConfig, test_logger: logging.Logger) -> None:
+    """Block browser creation until the app answers; stop the session if it never does."""
+    if test_config.ready_timeout <= 0:
+        return
+    urls = [test_config.base_url]
+    if test_config.api_url:
+        urls.append(test_config.api_url)
+    try:
+        ReadinessProbe(urls, timeout=test_config.ready_timeout).wait()
+    except AppNotReadyError as error:
+        test_logger.error("%s", error)
+        pytest.exit(
+            f"{error}\nIs the app running (make start) and APP_BASE_URL/APP_API_URL correct? "
+            "APP_READY_TIMEOUT=0 disables this check.",
+            returncode=pytest.ExitCode.TESTS_FAILED,
+        )
+
+
+@pytest.fixture(scope="module")
+def seed_store(target: Target | None) -> SeedStore:
+    # Depends on ``target`` so that every matrix target keeps its own seeds.
+    return SeedStore()
+
+
 def _configure_options(test_config: TestConfig) -> Options:
-    options = Options()
-    if test_config.headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument(f"--window-size={test_config.window_size}")
-    chrome_binary = os.getenv("CHROME_BIN", "/usr/bin/chromium")
-    if Path(chrome_binary).exists():
-        options.binary_location = chrome_binary
+    options = chrome_options(test_config)
+    if test_config.network_trace:
+        enable_performance_logging(options)
+    if test_config.console_capture:
+        console.enable_bidi(options)
     return options
 
 
@@ -143,10 +266,7 @@ def _prepare_driver(driver: webdriver.Chrome, base_url: str) -> None:
 
 
 def _new_browser(base_url: str, test_config: TestConfig) -> webdriver.Chrome:
-    options = _configure_options(test_config)
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(test_config.page_load_timeout)
-    driver.implicitly_wait(test_config.implicit_wait)
+    driver = new_browser(test_config, _configure_options(test_config))
     _prepare_driver(driver, base_url)
     return driver
 
@@ -165,6 +285,7 @@ def _save_screenshot(
     filename = f"{_safe_test_name(nodeid)}.png"
     path = target_dir / filename
     try:
+        target_dir.mkdir(parents=True, exist_ok=True)
         success = driver.save_screenshot(str(path))
     except Exception as error:  # noqa: BLE001
         logger.error("Failed to create screenshot %s: %s", path, error)
@@ -176,32 +297,322 @@ def _save_screenshot(
         logger.warning("Driver did not report success when saving screenshot to %s", path)
 
 
+def _save_network_trace(
+        driver: webdriver.Chrome,
+        trace: NetworkTrace,
+        target_dir: Path,
+        nodeid: str,
+        logger: logging.Logger,
+) -> None:
+    path = target_dir / f"{_safe_test_name(nodeid)}.har.json"
+    try:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        trace.collect(driver)
+        trace.dump(path)
+    except Exception as error:  # noqa: BLE001
+        logger.error("Failed to save network trace %s: %s", path, error)
+        return
+
+    logger.info("Saved network trace (%d events) to %s", len(trace), path)
+
+
+@pytest.fixture(scope="session")
+def browser_pool(base_url: str, test_config: TestConfig):
+    """One idle browser kept between tests when ``BROWSER_REUSE`` is on, else ``None``."""
+    if not test_config.browser_reuse:
+        yield None
+        return
+    pool = BrowserPool(lambda: _launch_browser(base_url, test_config))
+    yield pool
+    pool.close()
+
+
+def _launch_browser(base_url: str, test_config: TestConfig) -> PooledBrowser:
+    browser = _new_browser(base_url, test_config)
+    if TRACER.enabled:
+        add_command_listener(browser, TRACER.on_command)
+    capture = None
+    if test_config.console_capture:
+        capture = console.ConsoleCapture(test_config.console_capacity)
+        if not capture.attach(browser):
+            capture = None
+    return PooledBrowser(driver=browser, console=capture)
+
+
+def _memory_sample(browser: webdriver.Chrome, logger: logging.Logger) -> dict[str, float] | None:
+    try:
+        return memory.sample(browser)
+    except Exception as error:  # noqa: BLE001
+        logger.warning("Could not sample browser memory: %s", error)
+        return None
+
+
 @pytest.fixture
 def driver(
+        app_ready: None,
         base_url: str,
         test_config: TestConfig,
         test_logger: logging.Logger,
+        perf_monitor: perf.PerfMonitor | None,
+        browser_pool: BrowserPool | None,
         request: pytest.FixtureRequest,
 ):
-    test_logger.debug("Creating new browser instance for %s", request.node.nodeid)
-    browser = _new_browser(base_url, test_config)
+    if browser_pool is None:
+        test_logger.debug("Creating new browser instance for %s", request.node.nodeid)
+        pooled = _launch_browser(base_url, test_config)
+    else:
+        pooled = browser_pool.acquire()
+        if pooled.tests:
+            test_logger.debug("Reusing browser (%d tests so far) for %s", pooled.tests, request.node.nodeid)
+            _prepare_driver(pooled.driver, base_url)
+    browser = pooled.driver
+    capture = pooled.console
+    if capture is not None:
+        capture.clear()
+        # Read by pytest_runtest_makereport to attach the output to failures
+        # and to fail a passing call at CONSOLE_FAIL_LEVEL.
+        request.node.browser_console = capture
+        request.node.console_fail_level = test_config.console_fail_level
+    if perf_monitor is not None:
+        perf_monitor.start_test()
+        perf.attach(browser, perf_monitor)
+        # Read by pytest_runtest_makereport to check the budgets of the call.
+        request.node.perf_monitor = perf_monitor
+    before = _memory_sample(browser, test_logger) if test_config.memory_tracking else None
+    if pooled.baseline is None:
+        pooled.baseline = before
+    trace = None
+    if test_config.network_trace:
+        trace = NetworkTrace(test_config.network_trace_capacity)
+        trace.start(browser)
+        network.attach(browser, trace)
+    recorder = CommandRecorder(browser, request.node.nodeid) if test_config.command_recording else None
     try:
         yield browser
     finally:
+        if recorder is not None:
+            recorder.stop(test_config.log_dir / "recordings" / f"{_safe_test_name(request.node.nodeid)}.json.gz")
         outcome = getattr(request.node, "rep_call", None)
-        if outcome and outcome.failed:
+        failed = bool(outcome and outcome.failed)
+        if failed:
             _save_screenshot(
                 browser,
                 test_config.screenshots_dir,
                 request.node.nodeid,
                 test_logger,
             )
-        test_logger.debug("Closing browser instance for %s", request.node.nodeid)
-        browser.quit()
+            if trace is not None:
+                _save_network_trace(
+                    browser,
+                    trace,
+                    test_config.screenshots_dir,
+                    request.node.nodeid,
+                    test_logger,
+                )
+
+        recycle = None
+        after = _memory_sample(browser, test_logger) if before is not None else None
+        if after is not None:
+            MEMORY_REPORT.record(request.node.nodeid, before, after, browser_tests=pooled.tests + 1)
+            if browser_pool is not None and pooled.baseline is not None:
+                recycle = test_config.recycle_policy.reason(pooled.baseline, after)
+                if recycle:
+                    MEMORY_REPORT.record_recycle(request.node.nodeid, recycle, pooled.tests + 1)
+
+        if browser_pool is None:
+            test_logger.debug("Closing browser instance for %s", request.node.nodeid)
+            browser.quit()
+        else:
+            # A failed test may leave dialogs or a broken page behind; start afresh.
+            browser_pool.release(pooled, keep=not failed and recycle is None)
+
+
+@pytest.fixture
+def tabs(driver: webdriver.Chrome):
+    """Extra tabs of the test's browser; they are closed before the browser is released."""
+    browser_tabs = Tabs(driver)
+    yield browser_tabs
+    browser_tabs.close()
+
+
+def _check_console(item: pytest.Item, report: pytest.TestReport) -> None:
+    """Turn browser console messages at ``CONSOLE_FAIL_LEVEL`` or above into a failure of the call."""
+    capture = getattr(item, "browser_console", None)
+    fail_level = getattr(item, "console_fail_level", "off")
+    if capture is None or fail_level == "off":
+        return
+    offending = capture.at_or_above(fail_level)
+    if not offending:
+        return
+    lines = "\n".join(entry.format() for entry in offending)
+    logging.getLogger(LOGGER_NAME).error(
+        "Browser reported %d message(s) at %s or above in %s", len(offending), fail_level, item.nodeid,
+    )
+    report.outcome = "failed"
+    report.longrepr = f"Browser console has {fail_level} messages in {item.nodeid}:\n{lines}"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None):
+    set_current_test(item.nodeid)
+    with TRACER.span(item.nodeid, "test"):
+        yield
+    set_current_test(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    with TRACER.span("setup", "phase"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    with TRACER.span("call", "phase"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item | None):
+    with TRACER.span("teardown", "phase"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef: pytest.FixtureDef, request: pytest.FixtureRequest):
+    with TRACER.fixture(fixturedef):
+        yield
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
     outcome = yield
     result = outcome.get_result()
+    if result.when == "call" and result.passed:
+        _check_perf_budgets(item, result)
+        if result.passed:
+            _check_console(item, result)
     setattr(item, f"rep_{result.when}", result)
+
+    capture = getattr(item, "browser_console", None)
+    if result.failed and capture is not None and capture.entries:
+        result.sections.append(("Captured browser console", capture.format()))
+
+    if result.failed:
+        RESULT_CACHE.forget(item.nodeid)
+    elif result.when == "call" and result.passed:
+        RESULT_CACHE.record_pass(item.nodeid)
+
+    target = _item_target(item)
+    if target is not None and (result.when == "call" or not result.passed):
+        test = item.nodeid.split("[", 1)[0]
+        other_params = [
+            str(value) for name, value in item.callspec.params.items() if name != "target"
+        ]
+        if other_params:
+            test = f"{test}[{'-'.join(other_params)}]"
+        # Reports travel from xdist workers to the controller with their user
+        # properties, so pytest_runtest_logreport sees these on both sides.
+        result.user_properties += [("matrix_target", target.name), ("matrix_test", test)]
+
+    if result.when == "teardown":
+        _record_run(item, result)
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    properties = dict(report.user_properties)
+    if "matrix_target" in properties:
+        MATRIX_RESULTS.record(
+            properties["matrix_target"],
+            properties["matrix_test"],
+            report.outcome,
+            report.duration,
+        )
+
+
+def _record_run(item: pytest.Item, teardown: pytest.TestReport) -> None:
+    """Store the test's full duration for ``--smoke-budget``; skipped tests say nothing about cost."""
+    reports = [getattr(item, "rep_setup", None), getattr(item, "rep_call", None), teardown]
+    reports = [report for report in reports if report is not None]
+    if any(report.skipped for report in reports):
+        return
+    smoke.HISTORY.record(
+        item.nodeid,
+        sum(report.duration for report in reports),
+        failed=any(report.failed for report in reports),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    worker = worker_id()
+    TIMEOUT_HISTORY.save()
+    smoke.HISTORY.save(worker)
+    RESULT_CACHE.save()
+    RETRY_LEDGER.write(DEFAULT_LOG_DIR / ("quarantine.json" if worker == "main" else f"quarantine-{worker}.json"))
+    MEMORY_REPORT.write(DEFAULT_LOG_DIR / ("memory.json" if worker == "main" else f"memory-{worker}.json"))
+    if worker != "main":
+        TRACER.write(DEFAULT_LOG_DIR / f"trace-{worker}.json")
+    elif DEFAULT_TRACE:
+        # Under xdist the workers have written their tracks already; fold them in.
+        TRACER.write(DEFAULT_LOG_DIR / "trace-main.json")
+        merge_traces(sorted(DEFAULT_LOG_DIR.glob("trace-*.json")), DEFAULT_LOG_DIR / "trace.json")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    shutdown_logging()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    if RESULT_CACHE.reused:
+        terminalreporter.section("reused results")
+        for nodeid in RESULT_CACHE.reused:
+            terminalreporter.write_line(f"reused  {nodeid}")
+        terminalreporter.write_line(
+            f"{len(RESULT_CACHE.reused)} passing result(s) reused; use --full-run to execute them",
+        )
+
+    matrix_lines = MATRIX_RESULTS.summary_lines()
+    if matrix_lines:
+        terminalreporter.section("matrix results")
+        for line in matrix_lines:
+            terminalreporter.write_line(line)
+
+    quarantine = RETRY_LEDGER.report()
+    if quarantine["total_retries"]:
+        terminalreporter.section("step retries (quarantine candidates)")
+        for entry in quarantine["actions"][:10]:
+            errors = ", ".join(f"{name} x{count}" for name, count in entry["errors"].items())
+            terminalreporter.write_line(
+                f"{entry['retries']:4d} retries  {entry['time_s']:7.2f}s  "
+                f"{len(entry['tests']):3d} tests  {entry['action']}  ({errors})",
+            )
+        terminalreporter.write_line(
+            f"{quarantine['total_retries']} retries cost {quarantine['total_time_s']:.2f}s; "
+            f"details in {DEFAULT_LOG_DIR / 'quarantine.json'}",
+        )
+
+    growth = MEMORY_REPORT.ranked()
+    if growth:
+        terminalreporter.section("browser memory growth")
+        for nodeid, entry in growth[:10]:
+            change = entry["delta"]
+            terminalreporter.write_line(
+                f"{change.get('js_heap_mb', 0.0):+8.1f} MB  {change.get('dom_nodes', 0):+7.0f} nodes  "
+                f"{change.get('listeners', 0):+6.0f} listeners  {nodeid}",
+            )
+        if MEMORY_REPORT.recycles:
+            terminalreporter.write_line(f"{len(MEMORY_REPORT.recycles)} browser(s) recycled on memory growth")
+
+    ranked = WAIT_STATS.ranked()
+    if not ranked:
+        return
+
+    DEFAULT_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    (DEFAULT_LOG_DIR / "waits.json").write_text(json.dumps(dict(ranked), indent=2), encoding="utf-8")
+
+    terminalreporter.section("time spent waiting")
+    for name, entry in ranked[:10]:
+        terminalreporter.write_line(
+            f"{entry['total_s']:8.2f}s  {int(entry['count']):5d} waits  "
+            f"{int(entry['timeouts']):3d} timeouts  max {entry['max_s']:.2f}s  {name}",
+        )
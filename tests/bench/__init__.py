@@ -0,0 +1,4 @@
+"""Benchmarks of the page-object layer against a local stand-in app.
+
+Run with ``python -m tests.bench``; see ``tests/bench/__main__.py`` for options.
+"""
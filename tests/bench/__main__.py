@@ -0,0 +1,151 @@
+"""Time page-object primitives and flows against the local stand-in app.
+
+    python -m tests.bench --sizes 10,100,1000 --repeat 5
+
+Every case runs at every dataset size in a fresh state; the median of the
+repetitions is compared with the baseline (``bench-baseline.json``), and the
+run exits with 1 when a case got slower than the threshold allows.
+``--update-baseline`` stores the current numbers instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from ..config import TestConfig, standalone_config
+from ..utils.browser import new_browser
+from ..utils.logging import LOGGER_NAME
+from .cases import CASES, Case
+from .server import StandInServer
+
+logger = logging.getLogger(f"{LOGGER_NAME}.bench")
+
+# Below this absolute slowdown a relative change is treated as noise.
+NOISE_FLOOR_MS = 10.0
+
+
+def _reset(driver, url: str) -> None:
+    driver.get(f"{url}/#/labels")
+    driver.execute_script("window.sessionStorage.clear();")
+    driver.refresh()
+
+
+def _measure(driver, url: str, size: int, case: Case, repeat: int) -> dict:
+    samples = []
+    for run in range(repeat + 1):
+        _reset(driver, url)
+        step = case.prepare(driver, url, size)
+        started = time.perf_counter()
+        step()
+        elapsed = (time.perf_counter() - started) * 1000
+        if run:  # the first run warms up the browser and is discarded
+            samples.append(elapsed)
+    samples.sort()
+    return {
+        "kind": case.kind,
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(samples[0], 1),
+        "max_ms": round(samples[-1], 1),
+    }
+
+
+def run_bench(config: TestConfig, server: StandInServer, sizes: list[int], cases: list[Case], repeat: int) -> dict:
+    driver = new_browser(config)
+    results = {}
+    try:
+        for size in sizes:
+            url = server.url(size)
+            for case in cases:
+                key = f"{case.name}@{size}"
+                results[key] = _measure(driver, url, size, case, repeat)
+                logger.info("%-40s %8.1f ms", key, results[key]["median_ms"])
+    finally:
+        driver.quit()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        limit = previous["median_ms"] * (1 + threshold)
+        if result["median_ms"] > limit and result["median_ms"] - previous["median_ms"] > NOISE_FLOOR_MS:
+            regressions.append(
+                f"{key}: {result['median_ms']:.1f} ms vs baseline {previous['median_ms']:.1f} ms "
+                f"(+{(result['median_ms'] / previous['median_ms'] - 1) * 100:.0f}%)",
+            )
+    return regressions
+
+
+def _print_report(results: dict, baseline: dict) -> None:
+    header = f"{'case':<44}{'median':>9}{'min':>9}{'max':>9}{'baseline':>10}"
+    print(header)
+    print("-" * len(header))
+    for key, row in results.items():
+        previous = baseline.get(key, {}).get("median_ms")
+        print(
+            f"{key:<44}{row['median_ms']:>9.1f}{row['min_ms']:>9.1f}{row['max_ms']:>9.1f}"
+            f"{previous if previous is not None else '-':>10}",
+        )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000", help="comma separated dataset sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per case and size")
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=[case.name for case in CASES],
+        help="case to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--baseline", type=Path, default=Path("bench-baseline.json"))
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    parser.add_argument("--output", type=Path, default=Path("test-results/bench.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    cases = [case for case in CASES if not args.case or case.name in args.case]
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        baseline = {}
+
+    with StandInServer() as server:
+        config = standalone_config(server.origin)
+        results = run_bench(config, server, sizes, cases, args.repeat)
+
+    _print_report(results, baseline)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2), encoding="utf-8")
+        print(f"Baseline updated in {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
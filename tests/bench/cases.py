@@ -0,0 +1,83 @@
+"""Benchmark cases: ``prepare`` brings the page into position, the returned step is timed."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from ..constants import LIST_MAX_PER_PAGE
+from ..pages.labels import LabelsPage
+from ..pages.tasks import TasksPage
+
+Step = Callable[[], object]
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    name: str
+    kind: str
+    prepare: Callable[[object, str, int], Step]
+
+
+def _wait_for_text(driver, url: str, size: int) -> Step:
+    page = LabelsPage(driver, url)
+    page.show_all()
+    text = f"Label {min(size, LIST_MAX_PER_PAGE)}"
+    return lambda: page.wait_for_text(text)
+
+
+def _click_icon(driver, url: str, size: int) -> Step:
+    page = LabelsPage(driver, url)
+    page.show_all()
+    page.wait_for_rows()
+    return lambda: page.click_icon("Create")
+
+
+def _fill_input(driver, url: str, size: int) -> Step:
+    page = LabelsPage(driver, url)
+    page.show_all()
+    page.click_icon("Create")
+    return lambda: page.fill_input('input[name="name"]', "Benchmark label")
+
+
+def _select_from_dropdown(driver, url: str, size: int) -> Step:
+    page = TasksPage(driver, url)
+    page.open("tasks/create")
+    return lambda: page.select_from_dropdown('input[name="assignee_id"]', "user3@example.com")
+
+
+def _locate(driver, url: str, size: int) -> Step:
+    page = LabelsPage(driver, url)
+    return lambda: page.locate(f"Label {size}")
+
+
+def _create_label(driver, url: str, size: int) -> Step:
+    page = LabelsPage(driver, url)
+    return lambda: page.create_label("Benchmark label")
+
+
+def _create_task(driver, url: str, size: int) -> Step:
+    page = TasksPage(driver, url)
+    return lambda: page.create_task("Benchmark task", "Benchmark content", "user1@example.com", "Draft")
+
+
+def _task_in_status(driver, url: str, size: int) -> Step:
+    page = TasksPage(driver, url)
+    # Task N sits in status (N - 1) % 3, see the stand-in's initial state.
+    status = ("Draft", "Published", "Archived")[(size - 1) % 3]
+    return lambda: page.is_task_in_status(f"Task {size}", status)
+
+
+CASES = (
+    Case("BasePage.wait_for_text", "primitive", _wait_for_text),
+    Case("BasePage.click_icon", "primitive", _click_icon),
+    Case("BasePage.fill_input", "primitive", _fill_input),
+    Case("BasePage.select_from_dropdown", "primitive", _select_from_dropdown),
+    Case("ListPage.locate", "flow", _locate),
+    Case("LabelsPage.create_label", "flow", _create_label),
+    Case("TasksPage.create_task", "flow", _create_task),
+    Case("TasksPage.is_task_in_status", "flow", _task_in_status),
+)
+
+
+__all__ = ["CASES", "Case"]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PAGE = Path(__file__).with_name("standin.html")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    body = b""
+
+    def do_GET(self):  # noqa: N802
+        # Every path serves the same page; it reads the dataset size from the path.
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class StandInServer:
+    """Serve the stand-in page on a free local port for the duration of a ``with`` block."""
+
+    def __init__(self, host: str = "127.0.0.1"):
+        handler = type("StandInHandler", (_Handler,), {"body": PAGE.read_bytes()})
+        self._server = ThreadingHTTPServer((host, 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="bench-standin", daemon=True)
+
+    @property
+    def origin(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, size: int) -> str:
+        return f"{self.origin}/n/{size}"
+
+    def __enter__(self) -> StandInServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+__all__ = ["StandInServer"]
@@ -1,54 +1,170 @@
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import urlparse
 
-from .constants import IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT, WINDOW_SIZE
+from .constants import PAGE_LOAD_TIMEOUT, WINDOW_SIZE
+from .utils import console, memory, perf
+from .utils.matrix import Target
+from .utils.network import DEFAULT_CAPACITY
+
+DEFAULT_HEADLESS = os.getenv("HEADLESS", "true").lower() not in {"false", "0", "no"}
+DEFAULT_LOG_LEVEL = os.getenv("TEST_LOG_LEVEL", "INFO").upper()
+DEFAULT_LOG_DIR = Path(os.getenv("TEST_LOG_DIR", "test-results")).resolve()
+DEFAULT_LOG_QUEUE = os.getenv("TEST_LOG_QUEUE", "true").lower() not in {"false", "0", "no"}
+DEFAULT_LOG_JSON = os.getenv("TEST_LOG_JSON", "false").lower() in {"true", "1", "yes"}
+DEFAULT_LOG_MAX_BYTES = int(os.getenv("TEST_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+DEFAULT_LOG_BACKUPS = int(os.getenv("TEST_LOG_BACKUPS", "3"))
+DEFAULT_PERF_BUDGET_MODE = os.getenv("PERF_BUDGET_MODE", "warn").lower()
+DEFAULT_PERF_BUDGETS_FILE = Path(os.getenv("PERF_BUDGETS_FILE", "perf-budgets.json")).resolve()
+DEFAULT_NETWORK_TRACE = os.getenv("NETWORK_TRACE", "false").lower() in {"true", "1", "yes"}
+DEFAULT_NETWORK_TRACE_CAPACITY = int(os.getenv("NETWORK_TRACE_CAPACITY", str(DEFAULT_CAPACITY)))
+DEFAULT_CONSOLE_CAPTURE = os.getenv("BROWSER_CONSOLE", "true").lower() not in {"false", "0", "no"}
+DEFAULT_CONSOLE_CAPACITY = int(os.getenv("BROWSER_CONSOLE_CAPACITY", str(console.DEFAULT_CAPACITY)))
+DEFAULT_CONSOLE_FAIL_LEVEL = os.getenv("CONSOLE_FAIL_LEVEL", "off").lower()
+DEFAULT_BROWSER_REUSE = os.getenv("BROWSER_REUSE", "false").lower() in {"true", "1", "yes"}
+DEFAULT_MEMORY_TRACKING = os.getenv("MEMORY_TRACKING", "true").lower() not in {"false", "0", "no"}
+DEFAULT_RECYCLE_HEAP_MB = float(os.getenv("RECYCLE_HEAP_MB", "150"))
+DEFAULT_RECYCLE_DOM_NODES = float(os.getenv("RECYCLE_DOM_NODES", "20000"))
+DEFAULT_RECYCLE_LISTENERS = float(os.getenv("RECYCLE_LISTENERS", "10000"))
+DEFAULT_TRACE = os.getenv("TEST_TRACE", "false").lower() in {"true", "1", "yes"}
+DEFAULT_COMMAND_RECORDING = os.getenv("COMMAND_RECORDING", "false").lower() in {"true", "1", "yes"}
+DEFAULT_API_URL = os.getenv("APP_API_URL", "")
+DEFAULT_READY_TIMEOUT = float(os.getenv("APP_READY_TIMEOUT", "90"))
 
 
 @dataclass(frozen=True, slots=True)
 class TestConfig:
+    implementation: str | None
     base_url: str
+    api_url: str | None
+    target: str
+    matrix: bool
     log_level: str
     log_dir: Path
+    log_queue: bool
+    log_json: bool
+    log_max_bytes: int
+    log_backups: int
+    screenshots_dir: Path
     headless: bool
     window_size: str
     page_load_timeout: int
-    implicit_wait: float
+    network_trace: bool
+    network_trace_capacity: int
+    perf_budget_mode: str
+    perf_budgets_file: Path | None
+    ready_timeout: float
+    console_capture: bool
+    console_capacity: int
+    console_fail_level: str
+    browser_reuse: bool
+    memory_tracking: bool
+    command_recording: bool
+    recycle_policy: memory.RecyclePolicy
+
+
+@functools.cache
+def load_config(target: Target | None = None) -> TestConfig:
+    """The configuration of ``target``, built once and shared by hooks, fixtures and tools."""
+    implementation = target.implementation if target else os.getenv("IMPLEMENTATION")
+
+    if target:
+        base_url = target.base_url
+        descriptor = target.name
+    elif implementation:
+        base_url = f"http://{implementation}.test"
+        os.environ["APP_BASE_URL"] = base_url
+        descriptor = implementation
+    else:
+        base_url = os.getenv("APP_BASE_URL")
+        if not base_url:
+            message = (
+                "APP_BASE_URL is not set. "
+                "For local runs provide APP_BASE_URL (e.g. http://127.0.0.1:5173) "
+                "or use IMPLEMENTATION for prebuilt fixtures."
+            )
+            raise RuntimeError(message)
+        parsed = urlparse(base_url)
+        descriptor = parsed.hostname or "custom"
 
+    return _build(
+        base_url,
+        implementation=implementation,
+        descriptor=descriptor,
+        # APP_API_URL describes the single app under test, not every matrix target.
+        api_url=(DEFAULT_API_URL or None) if target is None else None,
+        matrix=target is not None,
+    )
 
-def _resolve_path(value: str) -> Path:
-    path = Path(value)
-    try:
-        return path.resolve()
-    except OSError:
-        # Fallback to absolute path joined with cwd if resolve() fails (e.g. path not yet created)
-        return Path.cwd() / path
 
+def standalone_config(base_url: str) -> TestConfig:
+    """The configuration of a tool that serves its own pages (bench, replay)."""
+    return _build(base_url, implementation=None, descriptor="standalone", api_url=None, matrix=False)
 
-def load_config() -> TestConfig:
-    base_url = os.getenv("APP_BASE_URL")
-    if not base_url:
-        raise RuntimeError("APP_BASE_URL environment variable must be set")
 
-    log_level = os.getenv("TEST_LOG_LEVEL", "INFO").upper()
-    log_dir = _resolve_path(os.getenv("TEST_LOG_DIR", "code/.logs"))
-    headless = os.getenv("HEADLESS", "true").lower() not in {"false", "0", "no"}
-    window_size = os.getenv("BROWSER_WINDOW_SIZE", WINDOW_SIZE)
-    page_load_timeout = int(os.getenv("PAGE_LOAD_TIMEOUT", str(PAGE_LOAD_TIMEOUT)))
-    implicit_wait = float(os.getenv("SELENIUM_IMPLICIT_WAIT", str(IMPLICIT_WAIT)))
+def _build(
+        base_url: str,
+        *,
+        implementation: str | None,
+        descriptor: str,
+        api_url: str | None,
+        matrix: bool,
+) -> TestConfig:
+    # Directories are created by whatever first writes into them.
+    log_dir = DEFAULT_LOG_DIR
+    screenshots_dir = log_dir / "screenshots" / descriptor
 
     return TestConfig(
+        implementation=implementation,
         base_url=base_url,
-        log_level=log_level,
+        api_url=api_url,
+        target=descriptor,
+        matrix=matrix,
+        log_level=DEFAULT_LOG_LEVEL,
         log_dir=log_dir,
-        headless=headless,
-        window_size=window_size,
-        page_load_timeout=page_load_timeout,
-        implicit_wait=implicit_wait,
+        log_queue=DEFAULT_LOG_QUEUE,
+        log_json=DEFAULT_LOG_JSON,
+        log_max_bytes=DEFAULT_LOG_MAX_BYTES,
+        log_backups=DEFAULT_LOG_BACKUPS,
+        screenshots_dir=screenshots_dir,
+        headless=DEFAULT_HEADLESS,
+        window_size=WINDOW_SIZE,
+        page_load_timeout=PAGE_LOAD_TIMEOUT,
+        network_trace=DEFAULT_NETWORK_TRACE,
+        network_trace_capacity=DEFAULT_NETWORK_TRACE_CAPACITY,
+        perf_budget_mode=_perf_budget_mode(),
+        perf_budgets_file=DEFAULT_PERF_BUDGETS_FILE if DEFAULT_PERF_BUDGETS_FILE.exists() else None,
+        ready_timeout=DEFAULT_READY_TIMEOUT,
+        console_capture=DEFAULT_CONSOLE_CAPTURE,
+        console_capacity=DEFAULT_CONSOLE_CAPACITY,
+        console_fail_level=_console_fail_level(),
+        browser_reuse=DEFAULT_BROWSER_REUSE,
+        memory_tracking=DEFAULT_MEMORY_TRACKING,
+        command_recording=DEFAULT_COMMAND_RECORDING,
+        recycle_policy=memory.RecyclePolicy(
+            js_heap_mb=DEFAULT_RECYCLE_HEAP_MB,
+            dom_nodes=DEFAULT_RECYCLE_DOM_NODES,
+            listeners=DEFAULT_RECYCLE_LISTENERS,
+        ),
     )
 
 
-__all__ = ["TestConfig", "load_config"]
+def _perf_budget_mode() -> str:
+    if DEFAULT_PERF_BUDGET_MODE not in perf.MODES:
+        options = ", ".join(sorted(perf.MODES))
+        raise RuntimeError(f"PERF_BUDGET_MODE must be one of: {options}")
+    return DEFAULT_PERF_BUDGET_MODE
+
+
+def _console_fail_level() -> str:
+    if DEFAULT_CONSOLE_FAIL_LEVEL not in console.FAIL_LEVELS:
+        options = ", ".join(sorted(console.FAIL_LEVELS))
+        raise RuntimeError(f"CONSOLE_FAIL_LEVEL must be one of: {options}")
+    return DEFAULT_CONSOLE_FAIL_LEVEL
+
 
+__all__ = ["DEFAULT_LOG_DIR", "DEFAULT_TRACE", "TestConfig", "load_config", "standalone_config"]
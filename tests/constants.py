@@ -8,6 +8,34 @@ USER = {
 DEFAULT_TIMEOUT = int(os.getenv("SELENIUM_DEFAULT_TIMEOUT", "8"))
 POLL_INTERVAL = float(os.getenv("SELENIUM_POLL_INTERVAL", "0.5"))
 PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "45"))
-IMPLICIT_WAIT = float(os.getenv("SELENIUM_IMPLICIT_WAIT", "0.2"))
 WINDOW_SIZE = os.getenv("BROWSER_WINDOW_SIZE", "1440,900")
+ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "true").lower() not in {"false", "0", "no"}
+ADAPTIVE_PERCENTILE = float(os.getenv("ADAPTIVE_PERCENTILE", "99"))
+ADAPTIVE_MIN_SAMPLES = int(os.getenv("ADAPTIVE_MIN_SAMPLES", "5"))
+ADAPTIVE_MIN_MARGIN = float(os.getenv("ADAPTIVE_MIN_MARGIN", "1.0"))
+WAIT_HISTORY_FILE = os.getenv("WAIT_HISTORY_FILE", "test-results/.wait-history.json")
+RUN_HISTORY_FILE = os.getenv("RUN_HISTORY_FILE", "test-results/.run-history.json")
+SMOKE_DEFAULT_COST = float(os.getenv("SMOKE_DEFAULT_COST", "30"))
+LIST_MAX_PER_PAGE = int(os.getenv("LIST_MAX_PER_PAGE", "500"))
+SEED_SCOPE = os.getenv("SEED_SCOPE", "function").lower()
+STEP_RETRY_ATTEMPTS = int(os.getenv("STEP_RETRY_ATTEMPTS", "3"))
+STEP_RETRY_BUDGET = int(os.getenv("STEP_RETRY_BUDGET", "5"))
+CI = os.getenv("CI", "false").lower() in {"true", "1", "yes"}
+VISUAL_BASELINE_DIR = os.getenv("VISUAL_BASELINE_DIR", "tests/visual-baselines")
+VISUAL_ARTIFACTS_DIR = os.getenv("VISUAL_ARTIFACTS_DIR", "test-results/visual")
+VISUAL_UPDATE = os.getenv("VISUAL_UPDATE", "false").lower() in {"true", "1", "yes"}
+VISUAL_TOLERANCE = int(os.getenv("VISUAL_TOLERANCE", "16"))
+VISUAL_MAX_DIFF_RATIO = float(os.getenv("VISUAL_MAX_DIFF_RATIO", "0.001"))
+VISUAL_CACHE_SIZE = int(os.getenv("VISUAL_CACHE_SIZE", "256"))
 
+
+APP_API_URL = os.getenv("APP_API_URL", "")
+
+SCALE_TESTS = os.getenv("SCALE_TESTS", "false").lower() in {"true", "1", "yes"}
+SCALE_CHANNEL = os.getenv("SCALE_CHANNEL", "rest")
+SCALE_STORAGE_KEY = os.getenv("SCALE_STORAGE_KEY", "ra-data-local-storage")
+SCALE_STATUSES = int(os.getenv("SCALE_STATUSES", "50"))
+SCALE_USERS = int(os.getenv("SCALE_USERS", "2000"))
+SCALE_LABELS = int(os.getenv("SCALE_LABELS", "20"))
+SCALE_TASKS = int(os.getenv("SCALE_TASKS", "10000"))
+SCALE_STEPS = tuple(float(step) for step in os.getenv("SCALE_STEPS", "0.01,0.1,1").split(","))
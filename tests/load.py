@@ -0,0 +1,285 @@
+"""Concurrent load runner built on the page objects.
+
+Run against a local instance, for example::
+
+    APP_BASE_URL=http://127.0.0.1:5173 python -m tests.load --browsers 5 --duration 120
+
+Each virtual user drives its own headless browser through the selected
+scenarios until the duration or iteration limit is reached. Latency is
+recorded per page-object action and summarised at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from urllib.parse import urlparse
+
+from .config import load_config
+from .constants import USER
+from .pages.labels import LabelsPage
+from .pages.login import LoginPage
+from .pages.statuses import StatusesPage
+from .pages.tasks import TasksPage
+from .pages.users import UsersPage
+from .utils.browser import new_browser
+from .utils.logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.load")
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "0.0.0.0", "::1"}
+
+
+class ActionStats:
+    """Thread-safe latency and error counters keyed by action name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def measure(self, action: str, func: Callable, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._add(action, time.perf_counter() - started, failed=True)
+            raise
+        # Page-object actions report a failed check by returning False.
+        self._add(action, time.perf_counter() - started, failed=result is False)
+        return result
+
+    def _add(self, action: str, elapsed: float, *, failed: bool) -> None:
+        with self._lock:
+            self.latencies[action].append(elapsed)
+            if failed:
+                self.errors[action] += 1
+
+    def summary(self, wall_time: float) -> dict[str, dict[str, float]]:
+        report = {}
+        for action, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            report[action] = {
+                "count": len(ordered),
+                "throughput_per_s": round(len(ordered) / wall_time, 3) if wall_time else 0.0,
+                "error_rate": round(self.errors[action] / len(ordered), 4),
+                "p50_s": _percentile(ordered, 50),
+                "p90_s": _percentile(ordered, 90),
+                "p95_s": _percentile(ordered, 95),
+                "p99_s": _percentile(ordered, 99),
+                "max_s": round(ordered[-1], 3),
+            }
+        return report
+
+
+def _percentile(ordered: list[float], percent: int) -> float:
+    index = max(0, -(-len(ordered) * percent // 100) - 1)
+    return round(ordered[index], 3)
+
+
+@dataclass(frozen=True, slots=True)
+class LoadSettings:
+    browsers: int
+    duration: float | None
+    iterations: int | None
+    ramp_up: float
+    think_time: float
+    scenarios: tuple[str, ...]
+
+
+class VirtualUser:
+    """One browser running scenarios in a loop; prepares its own reference data."""
+
+    def __init__(self, index: int, driver, base_url: str, stats: ActionStats):
+        self.index = index
+        self.driver = driver
+        self.base_url = base_url
+        self.stats = stats
+        self.tasks = TasksPage(driver, base_url)
+        self.labels = LabelsPage(driver, base_url)
+        self.status_name: str | None = None
+        self.assignee_email: str | None = None
+
+    def login(self) -> None:
+        self.stats.measure(
+            "LoginPage.login",
+            LoginPage(self.driver, self.base_url).login,
+            USER["login"],
+            USER["password"],
+        )
+
+    def _ensure_task_refs(self) -> None:
+        if self.status_name is not None:
+            return
+        suffix = f"{self.index}_{uuid.uuid4().hex[:5]}"
+        self.status_name = f"Load status {suffix}"
+        self.assignee_email = f"load_{suffix}@example.com"
+        StatusesPage(self.driver, self.base_url).create_status(self.status_name, f"load-{suffix}")
+        UsersPage(self.driver, self.base_url).create_user(self.assignee_email, "Load", "User")
+
+    def browse(self) -> None:
+        self.stats.measure("TasksPage.open_page", self.tasks.open_page)
+        self.stats.measure("LabelsPage.open_page", self.labels.open_page)
+
+    def tasks_flow(self) -> None:
+        self._ensure_task_refs()
+        title = f"Load_{uuid.uuid4().hex[:8]}"
+        self.stats.measure(
+            "TasksPage.create_task",
+            self.tasks.create_task,
+            title,
+            "Created by load runner",
+            self.assignee_email,
+            self.status_name,
+        )
+        self.stats.measure(
+            "TasksPage.edit_task",
+            self.tasks.edit_task,
+            title,
+            new_title=f"{title}_Edited",
+        )
+
+    def labels_flow(self) -> None:
+        name = f"Load_{uuid.uuid4().hex[:8]}"
+        self.stats.measure("LabelsPage.create_label", self.labels.create_label, name)
+        self.stats.measure("LabelsPage.delete_label", self.labels.delete_label, name)
+
+
+SCENARIOS: dict[str, Callable[[VirtualUser], None]] = {
+    "browse": VirtualUser.browse,
+    "tasks": VirtualUser.tasks_flow,
+    "labels": VirtualUser.labels_flow,
+}
+
+
+def _run_user(
+    index: int,
+    settings: LoadSettings,
+    config,
+    stats: ActionStats,
+    deadline: float | None,
+) -> None:
+    time.sleep(settings.ramp_up * index / settings.browsers)
+    driver = new_browser(config)
+    try:
+        user = VirtualUser(index, driver, config.base_url, stats)
+        user.login()
+        iteration = 0
+        while True:
+            if settings.iterations is not None and iteration >= settings.iterations:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            for name in settings.scenarios:
+                try:
+                    SCENARIOS[name](user)
+                except Exception as error:  # noqa: BLE001
+                    logger.warning("User %d: scenario %s failed: %s", index, name, error)
+                if settings.think_time:
+                    time.sleep(random.uniform(0.5, 1.5) * settings.think_time)
+            iteration += 1
+    except Exception as error:  # noqa: BLE001
+        logger.error("User %d aborted: %s", index, error)
+    finally:
+        driver.quit()
+
+
+def run_load(settings: LoadSettings, config) -> dict:
+    stats = ActionStats()
+    started = time.monotonic()
+    deadline = started + settings.duration if settings.duration else None
+    threads = [
+        threading.Thread(
+            target=_run_user,
+            args=(index, settings, config, stats, deadline),
+            name=f"vu-{index}",
+            daemon=True,
+        )
+        for index in range(settings.browsers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    wall_time = time.monotonic() - started
+    return {
+        "base_url": config.base_url,
+        "browsers": settings.browsers,
+        "wall_time_s": round(wall_time, 2),
+        "actions": stats.summary(wall_time),
+    }
+
+
+def _print_report(report: dict) -> None:
+    header = f"{'action':<28}{'count':>7}{'rps':>8}{'err%':>7}{'p50':>8}{'p95':>8}{'p99':>8}"
+    print(header)
+    print("-" * len(header))
+    for action, row in report["actions"].items():
+        print(
+            f"{action:<28}{row['count']:>7}{row['throughput_per_s']:>8.2f}"
+            f"{row['error_rate'] * 100:>7.1f}{row['p50_s']:>8.2f}{row['p95_s']:>8.2f}"
+            f"{row['p99_s']:>8.2f}",
+        )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.load", description=__doc__.splitlines()[0])
+    parser.add_argument("--browsers", type=int, default=4, help="concurrent headless browsers")
+    parser.add_argument("--duration", type=float, help="seconds to run (default: 60 unless --iterations)")
+    parser.add_argument("--iterations", type=int, help="scenario loops per browser")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="seconds to start all browsers")
+    parser.add_argument("--think-time", type=float, default=1.0, help="mean pause between scenarios")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="scenario to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--output", type=Path, default=Path("test-results/load.json"))
+    parser.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="permit a base URL that is not a local address",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(threadName)s: %(message)s")
+
+    config = replace(load_config(), headless=True)
+    host = urlparse(config.base_url).hostname or ""
+    if host not in LOCAL_HOSTS and not args.allow_remote:
+        raise SystemExit(f"Refusing to load {config.base_url}: not a local instance (use --allow-remote)")
+
+    duration = args.duration if args.duration or args.iterations else 60.0
+    settings = LoadSettings(
+        browsers=args.browsers,
+        duration=duration,
+        iterations=args.iterations,
+        ramp_up=args.ramp_up,
+        think_time=args.think_time,
+        scenarios=tuple(args.scenario or SCENARIOS),
+    )
+    report = run_load(settings, config)
+    _print_report(report)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
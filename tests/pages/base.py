@@ -1,70 +1,135 @@
 from __future__ import annotations
 
-from selenium.common.exceptions import NoSuchElementException
+import inspect
+import logging
+import time
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
-from ..constants import DEFAULT_TIMEOUT
+from ..utils import network, perf, visual
+from ..utils.logging import LOGGER_NAME, log_action
+from ..utils.retries import retry_step
 from ..utils.text import build_xpath_by_text
+from ..utils.tracing import traced, traced_methods
+from ..utils.waits import Wait
+from .cache import ElementCache
 
 
+@traced_methods("page")
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        logger = logging.getLogger(f"{LOGGER_NAME}.{cls.__module__.rsplit('.', 1)[-1]}")
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            if inspect.isgeneratorfunction(member):
+                continue
+            action = f"{cls.__name__}.{name}"
+            setattr(cls, name, traced("page", action)(log_action(logger, action)(member)))
+
     def __init__(self, driver, base_url: str):
         self.driver = driver
         self.base_url = base_url.rstrip("/")
-        self.wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+        self.wait = Wait(driver)
+        self.elements = ElementCache(driver)
+
+    def open(self, fragment: str = "", *, ready=None):
+        """Navigate to ``fragment`` and wait for the ``ready`` condition, returning its value.
 
-    def open(self, fragment: str = "") -> None:
+        With a perf monitor attached the route is timed in the browser from just
+        before the navigation until ``ready`` holds.
+        """
         fragment = fragment.lstrip("/")
         if fragment and not fragment.startswith("#/"):
             fragment = f"#/{fragment}"
 
         url = f"{self.base_url}/{fragment}" if fragment else self.base_url
+        self.elements.clear()
+        trace = network.trace_for(self.driver)
+        if trace is not None:
+            # Drain the previous route's events so chromedriver never piles up a whole test.
+            trace.collect(self.driver)
+        monitor = perf.monitor_for(self.driver)
+        if monitor is not None:
+            monitor.begin_route(self.driver)
+        started = time.perf_counter()
         self.driver.get(url)
+        result = self.wait.until(ready) if ready is not None else None
+        if monitor is not None:
+            route = fragment.removeprefix("#/").split("?", 1)[0] or "root"
+            monitor.record(self.driver, route, (time.perf_counter() - started) * 1000)
+        return result
+
+    def find_cached(self, locator: tuple[str, str], condition=EC.presence_of_element_located):
+        """Resolve ``locator`` once per route; later calls reuse the handle while it is fresh."""
+        key = (getattr(self, "route", ""), *locator)
+        return self.elements.get(
+            key,
+            lambda: self.wait.until(condition(locator)),
+            clickable=condition is EC.element_to_be_clickable,
+        )
 
     def wait_for_text(self, text: str, tag: str = "*"):
         locator = (By.XPATH, build_xpath_by_text(tag, text))
         return self.wait.until(EC.visibility_of_element_located(locator))
 
+    @retry_step
     def click_by_text(self, text: str, tag: str = "*"):
         element = self.wait_for_text(text, tag)
         element.click()
         return element
 
+    @retry_step
     def click_icon(self, aria_label: str):
         locator = (By.CSS_SELECTOR, f'[aria-label="{aria_label}"]')
         element = self.wait.until(EC.element_to_be_clickable(locator))
         element.click()
         return element
 
+    @retry_step
     def fill_input(self, selector: str, value: str):
-        field = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
+        field = self.find_cached((By.CSS_SELECTOR, selector), EC.element_to_be_clickable)
         field.clear()
         field.send_keys(value)
         return field
 
     def select_from_dropdown(self, selector: str, item_text: str):
-        element = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-
-        trigger = element
-        if element.tag_name.lower() == "input":
-            try:
-                trigger = element.find_element(
-                    By.XPATH,
-                    "./parent::*//*[@role='combobox']",
-                )
-            except NoSuchElementException:
-                trigger = element
+        trigger = self.elements.get(
+            (getattr(self, "route", ""), "dropdown-trigger", selector),
+            lambda: self._dropdown_trigger(selector),
+        )
 
         self.wait.until(lambda driver: trigger.is_displayed() and trigger.is_enabled())
         try:
             trigger.click()
         except Exception:  # noqa: BLE001
             self.driver.execute_script("arguments[0].click();", trigger)
+        return self._pick_option(item_text)
 
+    @retry_step
+    def _pick_option(self, item_text: str):
+        # Retried on its own: clicking the trigger again would close the open list.
         option_locator = (By.XPATH, build_xpath_by_text("li", item_text))
         option = self.wait.until(EC.element_to_be_clickable(option_locator))
         option.click()
         return option
 
+    def assert_looks_like(self, name: str, region=None) -> None:
+        """Compare a screenshot of ``region`` (locator, element or the viewport) with baseline ``name``."""
+        if region is None:
+            png = self.driver.get_screenshot_as_png()
+        else:
+            element = self.wait.until(EC.visibility_of_element_located(region)) if isinstance(region, tuple) else region
+            png = element.screenshot_as_png
+        visual.check(name, png)
+
+    def _dropdown_trigger(self, selector: str):
+        element = self.find_cached((By.CSS_SELECTOR, selector))
+        if element.tag_name.lower() != "input":
+            return element
+        # MUI renders the combobox in the same commit as its input, so there is
+        # nothing to wait for: without one the input itself is the trigger.
+        comboboxes = element.find_elements(By.XPATH, "./parent::*//*[@role='combobox']")
+        return comboboxes[0] if comboboxes else element
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+
+from selenium.common.exceptions import WebDriverException
+
+# Validates a cached element in a single round-trip. On first validation it also
+# arms a MutationObserver, so later changes to the element's children or
+# attributes (e.g. ``disabled``) mark it dirty even if the node stays attached.
+# With ``arguments[1]`` set the element must also be clickable: rendered and
+# not disabled, the same as ``element_to_be_clickable`` checks.
+FRESHNESS_SCRIPT = """
+const element = arguments[0];
+if (!element.isConnected || element.__pageObjectDirty) return false;
+if (arguments[1] && (element.disabled || !element.getClientRects().length)) return false;
+if (!element.__pageObjectObserver) {
+  element.__pageObjectObserver = new MutationObserver(() => {
+    element.__pageObjectDirty = true;
+    element.__pageObjectObserver.disconnect();
+  });
+  element.__pageObjectObserver.observe(element, {childList: true, subtree: true, attributes: true});
+}
+return true;
+"""
+
+
+class ElementCache:
+    """Element handles of one page object, keyed by route and locator.
+
+    ``BasePage.open`` clears the cache on navigation; anything else that
+    replaces the DOM is caught by the freshness check before an entry is reused.
+
+    A hit is not free: the freshness check is one ``execute_script`` round
+    trip. It replaces the find and the condition polling of a miss, which take
+    at least two, and it also covers the clickability a caller asks for.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._entries: dict[Hashable, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, find: Callable[[], object], *, clickable: bool = False):
+        element = self._entries.get(key)
+        if element is not None and self._is_fresh(element, clickable=clickable):
+            self.hits += 1
+            return element
+
+        self.misses += 1
+        element = find()
+        self._entries[key] = element
+        return element
+
+    def _is_fresh(self, element, *, clickable: bool) -> bool:
+        try:
+            return bool(self.driver.execute_script(FRESHNESS_SCRIPT, element, clickable))
+        except WebDriverException:
+            return False
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+__all__ = ["ElementCache"]
@@ -9,45 +9,37 @@ from selenium.webdriver.support import expected_conditions as EC
 from ..constants import DEFAULT_TIMEOUT
 from ..utils.logging import LOGGER_NAME
 from ..utils.text import build_xpath_by_text
-from .base import BasePage
+from .list import ListPage
 
 logger = logging.getLogger(f"{LOGGER_NAME}.labels")
 
 
-class LabelsPage(BasePage):
+class LabelsPage(ListPage):
     route = "labels"
 
     def _label_locator(self, name: str):
         return By.XPATH, build_xpath_by_text("*", name)
 
     def wait_until_label_present(self, name: str, timeout: int = DEFAULT_TIMEOUT):
-        locator = self._label_locator(name)
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if self.driver.find_elements(*locator):
-                return
-            time.sleep(0.5)
-        raise TimeoutException(f"Label '{name}' not found")
+        self.wait.until(
+            lambda driver: driver.find_elements(*self._label_locator(name)),
+            f"Label '{name}' not found",
+            timeout=timeout,
+        )
 
     def wait_until_label_absent(self, name: str, timeout: int = DEFAULT_TIMEOUT):
-        locator = self._label_locator(name)
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self.driver.find_elements(*locator):
-                return
-            time.sleep(0.5)
-        raise TimeoutException(f"Label '{name}' still present")
+        self.wait.until_not(
+            lambda driver: driver.find_elements(*self._label_locator(name)),
+            f"Label '{name}' still present",
+            timeout=timeout,
+        )
 
     def wait_for_notification(self, text: str, timeout: int = DEFAULT_TIMEOUT):
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if text in self.driver.page_source:
-                return
-            time.sleep(0.2)
-        raise TimeoutException(f"Notification '{text}' not shown")
-
-    def open_page(self) -> None:
-        self.open(self.route)
+        self.wait.until(
+            lambda driver: text in driver.page_source,
+            f"Notification '{text}' not shown",
+            timeout=timeout,
+        )
 
     def create_label(self, name: str) -> bool:
         logger.info("Creating label %s", name)
@@ -65,7 +57,7 @@ class LabelsPage(BasePage):
         )
         self.wait_for_notification("Element created")
         time.sleep(1)
-        self.open_page()
+        self.search(name)
         success = True
         try:
             self.wait_until_label_present(name, timeout=DEFAULT_TIMEOUT * 3)
@@ -77,8 +69,7 @@ class LabelsPage(BasePage):
 
     def edit_label(self, current_name: str, new_name: str) -> bool:
         logger.info("Editing label %s -> %s", current_name, new_name)
-        self.open_page()
-        self.click_by_text(current_name)
+        self.click_record(current_name)
         field = self.fill_input('input[name="name"]', "")
         field.send_keys(Keys.CONTROL + "a")
         field.send_keys(Keys.DELETE)
@@ -96,7 +87,7 @@ class LabelsPage(BasePage):
         except TimeoutException:
             logger.warning("Old label %s still visible after edit", current_name)
             success = False
-        self.open_page()
+        self.search(new_name)
         try:
             self.wait_until_label_present(new_name, timeout=DEFAULT_TIMEOUT * 3)
         except TimeoutException:
@@ -112,10 +103,12 @@ class LabelsPage(BasePage):
 
     def delete_label(self, name: str) -> bool:
         logger.info("Deleting label %s", name)
-        self.open_page()
-        self.click_by_text(name)
-        self.click_icon("Delete")
-        self.open_page()
+        try:
+            self.delete_record(name)
+        except TimeoutException:
+            logger.warning("Delete of %s was not confirmed", name)
+            return False
+        self.search(name)
         try:
             self.wait_until_label_absent(name)
             logger.info("Deleted label %s", name)
@@ -126,29 +119,8 @@ class LabelsPage(BasePage):
 
     def delete_all_labels(self) -> bool:
         logger.info("Deleting all labels")
-        self.open_page()
-        try:
-            checkbox = self.wait.until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, 'table thead tr th input[type="checkbox"]'),
-                ),
-            )
-        except TimeoutException:
-            logger.info("No labels to delete")
-            return True
-
-        checkbox.click()
-        self.click_icon("Delete")
-        self.open_page()
-        try:
-            self.wait_for_text("Do you want to add one?")
+        if self.delete_all_rows():
             logger.info("All labels removed")
             return True
-        except TimeoutException:
-            logger.warning("Empty state not visible after delete all")
-            return False
-
-    def get_table(self):
-        self.open_page()
-        return self.wait.until(EC.visibility_of_element_located((By.TAG_NAME, "table")))
-
+        logger.warning("Labels still listed after delete all")
+        return False
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from urllib.parse import urlencode
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from ..constants import LIST_MAX_PER_PAGE
+from ..utils.text import build_xpath_by_text
+from ..utils.waits import any_of
+from .base import BasePage
+
+ROW_SELECTOR = "tbody tr"
+EMPTY_STATE_TEXT = "Do you want to add one?"
+NO_RESULTS_TEXT = "No results found"
+NOTIFICATION_SELECTOR = ".MuiSnackbar-root"
+
+
+class ListPage(BasePage):
+    """A react-admin list that is paginated and filtered through its URL parameters.
+
+    react-admin remembers the last list parameters, so every ``open_page`` call
+    spells out the page and filter to avoid inheriting them from a previous step.
+    """
+
+    route = ""
+
+    def open_page(
+        self,
+        *,
+        page: int = 1,
+        per_page: int | None = None,
+        query: str | None = None,
+    ) -> None:
+        params = {
+            "filter": json.dumps({"q": query} if query else {}),
+            "page": page,
+        }
+        if per_page is not None:
+            params["perPage"] = per_page
+        self.open(f"{self.route}?{urlencode(params)}", ready=self._rendered())
+
+    def show_all(self) -> None:
+        self.open_page(per_page=LIST_MAX_PER_PAGE)
+
+    def search(self, text: str) -> None:
+        """Filter the list like its search box does, without typing and debounce."""
+        self.open_page(query=text)
+
+    @staticmethod
+    def _rendered():
+        """Rows, the empty state or the no-results message: the list has answered."""
+        return any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ROW_SELECTOR)),
+            EC.presence_of_element_located(
+                (By.XPATH, build_xpath_by_text("*", EMPTY_STATE_TEXT)),
+            ),
+            EC.presence_of_element_located(
+                (By.XPATH, build_xpath_by_text("*", NO_RESULTS_TEXT)),
+            ),
+        )
+
+    def wait_for_rows(self) -> int:
+        """Wait until the list has rendered and return the number of rows (0 when empty)."""
+        self.wait.until(self._rendered())
+        return len(self.driver.find_elements(By.CSS_SELECTOR, ROW_SELECTOR))
+
+    def iter_pages(self, per_page: int = LIST_MAX_PER_PAGE) -> Iterator[int]:
+        """Open the list page by page, yielding each page number once it has rows."""
+        page = 1
+        while True:
+            try:
+                self.open_page(page=page, per_page=per_page)
+                rows = self.wait_for_rows()
+            except TimeoutException:
+                return
+            if not rows:
+                return
+            yield page
+            if rows < per_page:
+                return
+            page += 1
+
+    def locate(self, text: str, tag: str = "*"):
+        """Return the element showing ``text`` or ``None``.
+
+        The list is filtered first; pages are walked only if the filter does
+        not surface the record, and the walk stops at the first match.
+        """
+        xpath = build_xpath_by_text(tag, text)
+        self.search(text)
+        # The filtered list has already rendered, so a miss is known without waiting.
+        elements = self.driver.find_elements(By.XPATH, xpath)
+        if elements:
+            return elements[0]
+
+        for _ in self.iter_pages():
+            elements = self.driver.find_elements(By.XPATH, xpath)
+            if elements:
+                return elements[0]
+        return None
+
+    def is_absent(self, text: str) -> bool:
+        """Check that no record shows ``text``, looking only at the filtered list."""
+        self.search(text)
+        try:
+            self.wait_for_rows()
+        except TimeoutException:
+            return False
+        try:
+            self.wait.until_not(
+                EC.presence_of_element_located((By.XPATH, build_xpath_by_text("*", text))),
+            )
+        except TimeoutException:
+            return False
+        return True
+
+    def click_record(self, text: str) -> None:
+        element = self.locate(text)
+        if element is None:
+            raise TimeoutException(f"Record '{text}' not found in {self.route}")
+        element.click()
+
+    def _select_all_rows(self) -> None:
+        header = self.driver.find_elements(
+            By.CSS_SELECTOR,
+            'table thead tr th input[type="checkbox"]',
+        )
+        if header:
+            header[0].click()
+            return
+        for row in self.driver.find_elements(By.CSS_SELECTOR, ROW_SELECTOR):
+            checkbox = self.wait.until(
+                lambda _, row=row: row.find_element(By.CSS_SELECTOR, 'input[type="checkbox"]'),
+            )
+            if not checkbox.is_selected():
+                checkbox.click()
+
+    def _wait_for_undoable_delete(self, removed) -> None:
+        """Wait until ``removed`` is gone and the undo notification has closed.
+
+        ``removed`` is a deleted row or the Delete button of the record's form.
+        react-admin removes them at once but sends the delete only when its
+        undo notification closes; reloading the list earlier brings them back.
+        """
+        self.wait.until(EC.staleness_of(removed))
+        self.wait.until(
+            EC.invisibility_of_element_located((By.CSS_SELECTOR, NOTIFICATION_SELECTOR)),
+        )
+
+    def delete_record(self, text: str) -> None:
+        """Delete the record showing ``text`` from its form and wait until the delete is sent."""
+        self.click_record(text)
+        button = self.click_icon("Delete")
+        self._wait_for_undoable_delete(button)
+
+    def delete_all_rows(self, max_rounds: int = 100) -> bool:
+        """Bulk-delete the list one (maximal) page at a time until it is empty."""
+        for _ in range(max_rounds):
+            self.show_all()
+            try:
+                if not self.wait_for_rows():
+                    return True
+                row = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ROW_SELECTOR)))
+                self._select_all_rows()
+                self.click_icon("Delete")
+                self._wait_for_undoable_delete(row)
+            except TimeoutException:
+                return False
+        return False
+
+    def get_table(self):
+        self.show_all()
+        return self.wait.until(EC.visibility_of_element_located((By.TAG_NAME, "table")))
+
+
+__all__ = ["ListPage"]
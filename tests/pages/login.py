@@ -1,10 +1,10 @@
 import logging
 
-from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..utils.logging import LOGGER_NAME
+from ..utils.text import build_xpath_by_text
 from .base import BasePage
 
 logger = logging.getLogger(f"{LOGGER_NAME}.login")
@@ -13,7 +13,7 @@ logger = logging.getLogger(f"{LOGGER_NAME}.login")
 class LoginPage(BasePage):
     def login(self, username: str, password: str) -> None:
         logger.info("Attempting login for %s", username)
-        self.open("login")
+        self.open("login", ready=EC.element_to_be_clickable((By.CSS_SELECTOR, 'input[name="username"]')))
         self.fill_input('input[name="username"]', username)
         self.fill_input('input[name="password"]', password)
         self.click_by_text("Sign in", "button")
@@ -22,9 +22,9 @@ class LoginPage(BasePage):
 
     def logout(self) -> None:
         logger.info("Performing logout")
-        self.open("tasks")
-        profile_button = self.wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Profile"]')),
+        profile_button = self.open(
+            "tasks",
+            ready=EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Profile"]')),
         )
         profile_button.click()
 
@@ -36,16 +36,10 @@ class LoginPage(BasePage):
         logger.info("Logout completed")
 
     def is_logged_in(self) -> bool:
-        try:
-            self.wait_for_text("Lorem ipsum sic dolor amet...")
-        except TimeoutException:
-            return False
-        return True
+        locator = (By.XPATH, build_xpath_by_text("*", "Lorem ipsum sic dolor amet..."))
+        return self.wait.probe(EC.visibility_of_element_located(locator), name="is_logged_in")
 
     def is_logged_out(self) -> bool:
-        try:
-            self.wait_for_text("Sign in", "button")
-        except TimeoutException:
-            return False
-        return True
+        locator = (By.XPATH, build_xpath_by_text("button", "Sign in"))
+        return self.wait.probe(EC.visibility_of_element_located(locator), name="is_logged_out")
 
@@ -6,18 +6,14 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..utils.logging import LOGGER_NAME
-from ..utils.text import build_xpath_by_text
-from .base import BasePage
+from .list import ListPage
 
 logger = logging.getLogger(f"{LOGGER_NAME}.statuses")
 
 
-class StatusesPage(BasePage):
+class StatusesPage(ListPage):
     route = "task_statuses"
 
-    def open_page(self) -> None:
-        self.open(self.route)
-
     def create_status(self, name: str, slug: str) -> bool:
         logger.info("Creating status %s (%s)", name, slug)
         self.open_page()
@@ -25,19 +21,15 @@ class StatusesPage(BasePage):
         self.fill_input('input[name="name"]', name)
         self.fill_input('input[name="slug"]', slug)
         self.click_icon("Save")
-        self.open_page()
-        try:
-            self.wait_for_text(name)
+        if self.locate(name) is not None:
             logger.info("Created status %s", name)
             return True
-        except TimeoutException:
-            logger.warning("Status %s not visible after creation", name)
-            return False
+        logger.warning("Status %s not visible after creation", name)
+        return False
 
     def edit_status(self, current_name: str, new_name: str) -> bool:
         logger.info("Editing status %s -> %s", current_name, new_name)
-        self.open_page()
-        self.click_by_text(current_name)
+        self.click_record(current_name)
         field = self.wait.until(
             EC.element_to_be_clickable((By.CSS_SELECTOR, 'input[name="name"]'))
         )
@@ -45,52 +37,29 @@ class StatusesPage(BasePage):
         field.send_keys(Keys.DELETE)
         field.send_keys(new_name)
         self.click_icon("Save")
-        self.open_page()
-        try:
-            self.wait_for_text(new_name)
+        if self.locate(new_name) is not None:
             logger.info("Finished editing status %s -> %s", current_name, new_name)
             return True
-        except TimeoutException:
-            logger.warning("New status name %s not visible after edit", new_name)
-            return False
+        logger.warning("New status name %s not visible after edit", new_name)
+        return False
 
     def delete_status(self, name: str) -> bool:
         logger.info("Deleting status %s", name)
-        self.open_page()
-        self.click_by_text(name)
-        self.click_icon("Delete")
-        self.open_page()
         try:
-            self.wait.until_not(
-                EC.presence_of_element_located((By.XPATH, build_xpath_by_text("*", name))),
-            )
-            logger.info("Deleted status %s", name)
-            return True
+            self.delete_record(name)
         except TimeoutException:
-            logger.warning("Status %s still visible after delete", name)
+            logger.warning("Delete of %s was not confirmed", name)
             return False
+        if self.is_absent(name):
+            logger.info("Deleted status %s", name)
+            return True
+        logger.warning("Status %s still visible after delete", name)
+        return False
 
     def delete_all_statuses(self) -> bool:
         logger.info("Deleting all statuses")
-        self.open_page()
-        try:
-            checkbox = self.wait.until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, 'table thead tr th input[type="checkbox"]'),
-                ),
-            )
-        except TimeoutException:
-            logger.info("No statuses to delete")
-            return True
-
-        checkbox.click()
-        self.click_icon("Delete")
-        self.open_page()
-        try:
-            self.wait_for_text("Do you want to add one?")
+        if self.delete_all_rows():
             logger.info("All statuses removed")
             return True
-        except TimeoutException:
-            logger.warning("Empty state not visible after delete all")
-            return False
-
+        logger.warning("Statuses still listed after delete all")
+        return False
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Generator
+
+from ..utils.logging import LOGGER_NAME
+from .base import BasePage
+
+logger = logging.getLogger(f"{LOGGER_NAME}.tabs")
+
+
+class TabPage[PageT: BasePage]:
+    """A page object bound to one browser tab.
+
+    Attribute access is forwarded to the page; calling one of its methods first
+    makes the tab current, so steps of different tabs can be mixed freely.
+    """
+
+    def __init__(self, tabs: Tabs, page: PageT, handle: str):
+        self._tabs = tabs
+        self.page = page
+        self.handle = handle
+
+    def __getattr__(self, name: str):
+        value = getattr(self.page, name)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            self._tabs.activate(self.handle)
+            return value(*args, **kwargs)
+
+        return call
+
+
+class Tabs:
+    """Several tabs of one browser, each with its own page object.
+
+    Tabs share the browser's cookies and storage, so they act as one signed-in
+    user looking at several views, at the cost of a single browser.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.main = driver.current_window_handle
+        self._current = self.main
+        self._opened: list[str] = []
+
+    def activate(self, handle: str) -> None:
+        # Switching costs a round-trip, so only switch when another tab acted last.
+        if handle != self._current:
+            self.driver.switch_to.window(handle)
+            self._current = handle
+
+    def bind[PageT: BasePage](self, page: PageT) -> TabPage[PageT]:
+        """Bind an existing page object to the main tab."""
+        return TabPage(self, page, self.main)
+
+    def open[PageT: BasePage](self, page_cls: type[PageT], *args, **kwargs) -> TabPage[PageT]:
+        """Open a new tab and bind a fresh ``page_cls(driver, *args, **kwargs)`` to it."""
+        self.driver.switch_to.new_window("tab")
+        handle = self.driver.current_window_handle
+        self._current = handle
+        self._opened.append(handle)
+        logger.info("Opened tab %d for %s", len(self._opened), page_cls.__name__)
+        return TabPage(self, page_cls(self.driver, *args, **kwargs), handle)
+
+    def interleave(self, *flows: Generator) -> list:
+        """Run generator flows round-robin, one step (up to the next ``yield``) at a time.
+
+        Returns each flow's return value, in the order the flows were given.
+        """
+        results: list = [None] * len(flows)
+        pending = dict(enumerate(flows))
+        while pending:
+            for index, flow in list(pending.items()):
+                try:
+                    next(flow)
+                except StopIteration as stop:
+                    results[index] = stop.value
+                    del pending[index]
+        return results
+
+    def close(self) -> None:
+        """Close every opened tab and return to the main one."""
+        for handle in self._opened:
+            self.activate(handle)
+            self.driver.close()
+            self._current = None
+        self._opened.clear()
+        self.driver.switch_to.window(self.main)
+        self._current = self.main
+
+
+__all__ = ["TabPage", "Tabs"]
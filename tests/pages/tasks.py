@@ -1,6 +1,7 @@
 import logging
 
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,13 +12,17 @@ from .base import BasePage
 
 logger = logging.getLogger(f"{LOGGER_NAME}.tasks")
 
+DROPPABLE_ATTR = "data-rfd-droppable-id"
+DRAG_HANDLE_ATTR = "data-rfd-drag-handle-draggable-id"
+# Pause between keyboard-sensor steps so the DnD library can settle each move.
+DND_STEP_PAUSE = 0.1
+
 
 class TasksPage(BasePage):
     route = "tasks"
 
     def open_page(self) -> None:
-        self.open(self.route)
-        self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Create"]')))
+        self.open(self.route, ready=EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Create"]')))
 
     def create_task(
         self,
@@ -49,9 +54,7 @@ class TasksPage(BasePage):
     def task_exists(self, title: str) -> bool:
         self.open_page()
         try:
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, build_xpath_by_text("*", title)))
-            )
+            self.wait.until(EC.presence_of_element_located((By.XPATH, build_xpath_by_text("*", title))))
         except TimeoutException:
             return False
         return True
@@ -61,12 +64,20 @@ class TasksPage(BasePage):
         return f"{heading_xpath}/ancestor::div[contains(@class,'MuiCard-root')]"
 
     def _open_edit(self, title: str) -> None:
-        card_xpath = self._task_card_xpath(title)
-        self.wait.until(EC.presence_of_element_located((By.XPATH, card_xpath)))
-        edit_xpath = (
-            f"{card_xpath}//button[@aria-label='Edit'] | {card_xpath}//a[@aria-label='Edit']"
+        card = self.find_cached((By.XPATH, self._task_card_xpath(title)))
+        edit_button = self.wait.until(
+            lambda driver: next(
+                (
+                    button
+                    for button in card.find_elements(
+                        By.XPATH,
+                        ".//button[@aria-label='Edit'] | .//a[@aria-label='Edit']",
+                    )
+                    if button.is_displayed() and button.is_enabled()
+                ),
+                False,
+            ),
         )
-        edit_button = self.wait.until(EC.element_to_be_clickable((By.XPATH, edit_xpath)))
         edit_button.click()
 
     def edit_task(
@@ -119,14 +130,94 @@ class TasksPage(BasePage):
 
     def is_task_in_status(self, title: str, status_name: str) -> bool:
         self.open_page()
-        column_xpath = (
-            f"//*[normalize-space()='{status_name}']/following::div[@data-rfd-droppable-id][1]"
-        )
+        return self.wait_for_task_in_status(title, status_name)
+
+    def wait_for_task_in_status(self, title: str, status_name: str) -> bool:
+        """Wait for the card to reach the column on the board as it is, without reloading it."""
+        card_xpath = f"{self._column_xpath(status_name)}{self._card_in_column_xpath(title).removeprefix('.')}"
         try:
-            column = self.wait.until(EC.presence_of_element_located((By.XPATH, column_xpath)))
-            column.find_element(By.XPATH, f".//div[contains(@class,'MuiCard-root')]//*[normalize-space()='{title}']")
+            self.wait.until(EC.presence_of_element_located((By.XPATH, card_xpath)))
         except TimeoutException:
             return False
-        except NoSuchElementException:
+        return True
+
+    def _column_xpath(self, status_name: str) -> str:
+        status_xpath = build_xpath_by_text("*", status_name)
+        return f"{status_xpath}/following::div[@{DROPPABLE_ATTR}][1]"
+
+    def _card_in_column_xpath(self, title: str) -> str:
+        return f".//div[contains(@class,'MuiCard-root')]{build_xpath_by_text('*', title)}"
+
+    def _board_columns(self) -> list[str]:
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(`[${arguments[0]}]`),"
+            " (column) => column.getAttribute(arguments[0]));",
+            DROPPABLE_ATTR,
+        )
+
+    def _drag_task(self, title: str, target_column: str, columns: list[str]) -> None:
+        """Move a card with the keyboard sensor: lift, arrow across columns, drop."""
+        handle = self.wait.until(
+            EC.presence_of_element_located(
+                (
+                    By.XPATH,
+                    f"{build_xpath_by_text('*', title)}/ancestor-or-self::*[@{DRAG_HANDLE_ATTR}][1]",
+                ),
+            ),
+        )
+        source_column = self.wait.until(
+            lambda _: handle.find_element(By.XPATH, f"./ancestor::*[@{DROPPABLE_ATTR}][1]"),
+        ).get_attribute(DROPPABLE_ATTR)
+        steps = columns.index(target_column) - columns.index(source_column)
+        if steps == 0:
+            return
+
+        arrow = Keys.ARROW_RIGHT if steps > 0 else Keys.ARROW_LEFT
+        self.driver.execute_script("arguments[0].focus();", handle)
+        actions = ActionChains(self.driver).send_keys(Keys.SPACE).pause(DND_STEP_PAUSE)
+        for _ in range(abs(steps)):
+            actions.send_keys(arrow).pause(DND_STEP_PAUSE)
+        actions.send_keys(Keys.SPACE).perform()
+
+    def _wait_in_column(self, title: str, target_column: str) -> bool:
+        card_xpath = (
+            f"//div[@{DROPPABLE_ATTR}='{target_column}']"
+            f"{self._card_in_column_xpath(title).removeprefix('.')}"
+        )
+        try:
+            self.wait.until(
+                EC.presence_of_element_located((By.XPATH, card_xpath)),
+            )
+        except TimeoutException:
             return False
         return True
+
+    def move_task(self, title: str, status_name: str) -> bool:
+        """Drag a card to another status column and confirm it from the board, without a reload."""
+        return self.move_tasks({title: status_name})[title]
+
+    def move_tasks(self, moves: dict[str, str]) -> dict[str, bool]:
+        """Drag several cards in one board visit, one after another.
+
+        react-beautiful-dnd ignores a lift while the previous drop is still
+        animating, so each card must reach its column before the next drag.
+        """
+        logger.info("Moving %d task(s) on the board", len(moves))
+        self.open_page()
+        columns = self._board_columns()
+        targets = {}
+        for status_name in set(moves.values()):
+            column = self.wait.until(
+                EC.presence_of_element_located((By.XPATH, self._column_xpath(status_name))),
+            )
+            targets[status_name] = column.get_attribute(DROPPABLE_ATTR)
+
+        results = {}
+        for title, status_name in moves.items():
+            self._drag_task(title, targets[status_name], columns)
+            results[title] = self._wait_in_column(title, targets[status_name])
+        for title, moved in results.items():
+            if not moved:
+                logger.warning("Task %s did not land in %s", title, moves[title])
+        logger.info("Moved %d/%d task(s)", sum(results.values()), len(results))
+        return results
@@ -0,0 +1,204 @@
+"""Replay recorded WebDriver commands against static snapshots of the recorded pages.
+
+Record with ``COMMAND_RECORDING=true``, then for example::
+
+    python -m tests.replay test-results/recordings/*.json.gz --baseline replay-baseline.json
+
+Every recording runs in a fresh browser. Snapshots are served from a local
+server in place of the app, navigations load the matching snapshot, and
+element references are mapped from the recorded session to the replayed one.
+Command counts and latency are reported per command, next to the recorded
+numbers and, when given, a previous replay; commands the static page cannot
+satisfy are counted as failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+from .config import standalone_config
+from .utils.browser import new_browser
+from .utils.logging import LOGGER_NAME
+from .utils.recorder import ELEMENT_KEY, TRUNCATED_KEY, load_recording
+
+logger = logging.getLogger(f"{LOGGER_NAME}.replay")
+
+# Navigation is replaced by loading snapshots; the rest only concerns the recording session.
+SKIPPED_COMMANDS = {"get", "quit", "getLog", "executeCdpCommand", "newSession"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    snapshots: dict[str, bytes] = {}
+
+    def do_GET(self):  # noqa: N802
+        body = self.snapshots.get(self.path.strip("/").split("/")[-1])
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+class SnapshotServer:
+    """Serve recorded snapshots on a free local port for the duration of a ``with`` block."""
+
+    def __init__(self, host: str = "127.0.0.1"):
+        self._snapshots: dict[str, bytes] = {}
+        handler = type("SnapshotHandler", (_Handler,), {"snapshots": self._snapshots})
+        self._server = ThreadingHTTPServer((host, 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-snapshots", daemon=True)
+
+    def add(self, snapshots: dict[str, str]) -> None:
+        self._snapshots.update({key: html.encode("utf-8") for key, html in snapshots.items()})
+
+    def url(self, key: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/s/{key}"
+
+    def __enter__(self) -> SnapshotServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _remap(value, elements: dict[str, str]):
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value:
+            return {ELEMENT_KEY: elements.get(value[ELEMENT_KEY], value[ELEMENT_KEY])}
+        return {key: _remap(item, elements) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_remap(item, elements) for item in value]
+    return value
+
+
+def _learn(recorded, replayed, elements: dict[str, str]) -> None:
+    """Map element ids of the recorded response onto those of the replayed one."""
+    if isinstance(recorded, dict) and isinstance(replayed, dict):
+        if ELEMENT_KEY in recorded and ELEMENT_KEY in replayed:
+            elements[recorded[ELEMENT_KEY]] = replayed[ELEMENT_KEY]
+            return
+        for key, item in recorded.items():
+            _learn(item, replayed.get(key), elements)
+    elif isinstance(recorded, list) and isinstance(replayed, list) and len(recorded) == len(replayed):
+        # Lists of another length (e.g. find_elements matched more) cannot be paired by position.
+        for recorded_item, replayed_item in zip(recorded, replayed, strict=True):
+            _learn(recorded_item, replayed_item, elements)
+
+
+def _truncated(value) -> bool:
+    if isinstance(value, dict):
+        return TRUNCATED_KEY in value or any(_truncated(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_truncated(item) for item in value)
+    return False
+
+
+def replay(driver, recording: dict, server: SnapshotServer) -> dict:
+    elements: dict[str, str] = {}
+    commands: dict[str, dict] = defaultdict(lambda: {"count": 0, "failed": 0, "recorded_ms": 0.0, "replayed_ms": 0.0})
+    skipped = 0
+    for record in recording["commands"]:
+        if "snapshot" in record:
+            driver.get(server.url(record["snapshot"]))
+            continue
+        if record["command"] in SKIPPED_COMMANDS or _truncated(record["params"]):
+            skipped += 1
+            continue
+        row = commands[record["command"]]
+        params = _remap(record["params"], elements)
+        started = time.perf_counter()
+        try:
+            response = driver.execute(record["command"], params) or {}
+        except WebDriverException:
+            row["failed"] += 1
+            response = {}
+        row["replayed_ms"] += (time.perf_counter() - started) * 1000
+        row["recorded_ms"] += record["ms"]
+        row["count"] += 1
+        _learn(record["value"], response.get("value"), elements)
+
+    for row in commands.values():
+        row["recorded_ms"] = round(row["recorded_ms"], 1)
+        row["replayed_ms"] = round(row["replayed_ms"], 1)
+    return {
+        "count": sum(row["count"] for row in commands.values()),
+        "failed": sum(row["failed"] for row in commands.values()),
+        "skipped": skipped,
+        "recorded_ms": round(sum(row["recorded_ms"] for row in commands.values()), 1),
+        "replayed_ms": round(sum(row["replayed_ms"] for row in commands.values()), 1),
+        "commands": dict(sorted(commands.items())),
+    }
+
+
+def _print_report(results: dict, baseline: dict) -> None:
+    header = f"{'test / command':<56}{'count':>7}{'failed':>8}{'recorded':>10}{'replayed':>10}{'baseline':>10}"
+    print(header)
+    print("-" * len(header))
+    for test, result in results.items():
+        previous = baseline.get(test, {})
+        rows = [(test, result, previous)]
+        rows += [
+            (f"  {name}", row, previous.get("commands", {}).get(name, {}))
+            for name, row in result["commands"].items()
+        ]
+        for label, row, before in rows:
+            reference = f"{before['count']}/{before['replayed_ms']:.0f}" if before else "-"
+            print(
+                f"{label:<56}{row['count']:>7}{row['failed']:>8}"
+                f"{row['recorded_ms']:>10.1f}{row['replayed_ms']:>10.1f}{reference:>10}",
+            )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.replay", description=__doc__.splitlines()[0])
+    parser.add_argument("recordings", nargs="+", type=Path, help="files written with COMMAND_RECORDING=true")
+    parser.add_argument("--baseline", type=Path, help="earlier replay output to compare with")
+    parser.add_argument("--output", type=Path, default=Path("test-results/replay.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else {}
+    except (OSError, ValueError):
+        baseline = {}
+
+    results = {}
+    with SnapshotServer() as server:
+        config = standalone_config("about:blank")
+        for path in args.recordings:
+            recording = load_recording(path)
+            server.add(recording["snapshots"])
+            driver = new_browser(config)
+            try:
+                results[recording["test"]] = replay(driver, recording, server)
+            finally:
+                driver.quit()
+            logger.info("Replayed %s: %d commands", recording["test"], results[recording["test"]]["count"])
+
+    _print_report(results, baseline)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
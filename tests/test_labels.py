@@ -8,20 +8,28 @@ from .pages.login import LoginPage
 
 
 @pytest.fixture()
-def labels_page(driver, base_url):
-    login_page = LoginPage(driver, base_url)
-    login_page.login(USER["login"], USER["password"])
+def labels_page(driver, base_url, seed_store, request):
     page = LabelsPage(driver, base_url)
-    assert page.delete_all_labels()
-    assert page.create_label("Label_Name")
+
+    def seed():
+        login_page = LoginPage(driver, base_url)
+        login_page.login(USER["login"], USER["password"])
+        assert page.delete_all_labels()
+        assert page.create_label("Label_Name")
+
+    seed_store.provide(request, driver, "labels", seed)
     return page
 
 
 @pytest.fixture()
-def seeded_label(labels_page):
-    name = f"Label_{uuid.uuid4().hex[:5]}"
-    assert labels_page.create_label(name)
-    return labels_page, name
+def seeded_label(labels_page, driver, base_url, seed_store, request):
+    def seed():
+        name = f"Label_{uuid.uuid4().hex[:5]}"
+        assert labels_page.create_label(name)
+        return {"name": name}
+
+    data = seed_store.provide(request, driver, "seeded_label", seed)
+    return labels_page, data["name"]
 
 
 def test_create_label(labels_page):
@@ -35,17 +43,20 @@ def test_view_labels_list(labels_page):
     assert labels_page.get_table() is not None
 
 
+@pytest.mark.mutates_seed
 def test_edit_label(seeded_label):
     labels_page, name = seeded_label
     new_name = f"{name} Updated"
     assert labels_page.edit_label(name, new_name)
 
 
+@pytest.mark.mutates_seed
 def test_delete_label(seeded_label):
     labels_page, name = seeded_label
     assert labels_page.delete_label(name)
 
 
+@pytest.mark.mutates_seed
 def test_delete_all_labels(seeded_label):
     labels_page, name = seeded_label
     assert labels_page.delete_all_labels()
@@ -0,0 +1,120 @@
+import json
+import math
+import time
+from pathlib import Path
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from .constants import (
+    APP_API_URL,
+    SCALE_CHANNEL,
+    SCALE_LABELS,
+    SCALE_STATUSES,
+    SCALE_STEPS,
+    SCALE_STORAGE_KEY,
+    SCALE_TASKS,
+    SCALE_TESTS,
+    SCALE_USERS,
+    USER,
+)
+from .pages.login import LoginPage
+from .pages.tasks import TasksPage
+from .pages.users import UsersPage
+from .utils.seeding import Dataset, RestSeedChannel, StorageSeedChannel, generate_dataset
+
+pytestmark = pytest.mark.skipif(not SCALE_TESTS, reason="set SCALE_TESTS=true to run scale tests")
+
+
+def _volume(dataset: Dataset, fraction: float) -> dict[str, int]:
+    full = dataset.counts()
+    return {resource: max(1, math.ceil(count * fraction)) for resource, count in full.items()}
+
+
+def _timed(func, *args):
+    """Call ``func`` and return the seconds it took along with its result."""
+    started = time.perf_counter()
+    result = func(*args)
+    return round(time.perf_counter() - started, 3), result
+
+
+@pytest.fixture(scope="module")
+def growth_curve(test_config, test_logger):
+    curve: list[dict] = []
+    yield curve
+    if not curve:
+        return
+    baseline = curve[0]
+    for point in curve:
+        point["growth"] = {
+            metric: round(point[metric] / baseline[metric], 2) if baseline[metric] else None
+            for metric in ("tasks_board_s", "users_list_s", "task_lookup_s", "user_lookup_s")
+        }
+    path = Path(test_config.log_dir) / "scale.json"
+    path.write_text(json.dumps(curve, indent=2), encoding="utf-8")
+    test_logger.info("Scale growth curve written to %s", path)
+    for point in curve:
+        test_logger.info("  tasks=%6d: %s", point["volume"]["tasks"], point["growth"])
+
+
+@pytest.fixture(scope="module")
+def scale_dataset() -> Dataset:
+    return generate_dataset(
+        statuses=SCALE_STATUSES,
+        users=SCALE_USERS,
+        labels=SCALE_LABELS,
+        tasks=SCALE_TASKS,
+    )
+
+
+@pytest.fixture(scope="module")
+def rest_channel():
+    """Shared by all steps: it remembers what it created, so each step only posts the difference."""
+    if not APP_API_URL:
+        pytest.skip("APP_API_URL is required for the rest seeding channel")
+    channel = RestSeedChannel(APP_API_URL)
+    yield channel
+    channel.close()
+
+
+@pytest.fixture()
+def seeded_app(driver, base_url, scale_dataset, request):
+    volume = _volume(scale_dataset, request.param)
+    dataset = scale_dataset.head(**volume)
+    if SCALE_CHANNEL == "storage":
+        StorageSeedChannel(driver, SCALE_STORAGE_KEY).load(dataset)
+    else:
+        request.getfixturevalue("rest_channel").load(dataset)
+
+    LoginPage(driver, base_url).login(USER["login"], USER["password"])
+    return dataset, volume
+
+
+@pytest.mark.parametrize("seeded_app", SCALE_STEPS, indirect=True, ids=lambda step: f"x{step}")
+def test_render_cost_grows_with_volume(driver, base_url, seeded_app, growth_curve):
+    dataset, volume = seeded_app
+    tasks_page = TasksPage(driver, base_url)
+    users_page = UsersPage(driver, base_url)
+
+    tasks_board_s, _ = _timed(tasks_page.open_page)
+    users_list_s, _ = _timed(
+        lambda: (
+            users_page.open_page(),
+            users_page.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr"))),
+        ),
+    )
+    last_task, last_user = dataset.tasks[-1]["title"], dataset.users[-1]["email"]
+    task_lookup_s, task_found = _timed(tasks_page.task_exists, last_task)
+    assert task_found, f"{last_task} is not on the board"
+    # The last user of the volume is the one a growing list pages to last.
+    user_lookup_s, user_row = _timed(users_page.locate, last_user)
+    assert user_row is not None, f"{last_user} is not in the users list"
+
+    growth_curve.append({
+        "volume": volume,
+        "tasks_board_s": tasks_board_s,
+        "users_list_s": users_list_s,
+        "task_lookup_s": task_lookup_s,
+        "user_lookup_s": user_lookup_s,
+    })
@@ -0,0 +1,20 @@
+import math
+
+import pytest
+
+from .constants import SCALE_STEPS
+from .utils.seeding import FOREIGN_KEYS, generate_dataset
+
+
+@pytest.mark.parametrize("step", SCALE_STEPS, ids=lambda step: f"x{step}")
+def test_head_only_references_kept_records(step):
+    dataset = generate_dataset()
+    volume = {resource: max(1, math.ceil(count * step)) for resource, count in dataset.counts().items()}
+    head = dataset.head(**volume)
+
+    kept = {resource: {record["id"] for record in getattr(head, resource)} for resource in FOREIGN_KEYS.values()}
+    for task in head.tasks:
+        for key, resource in FOREIGN_KEYS.items():
+            value = task[key]
+            references = value if isinstance(value, list) else [value]
+            assert set(references) <= kept[resource], f"task {task['id']} {key}={value}"
@@ -8,20 +8,28 @@ from .pages.statuses import StatusesPage
 
 
 @pytest.fixture()
-def statuses_page(driver, base_url):
-    login_page = LoginPage(driver, base_url)
-    login_page.login(USER["login"], USER["password"])
+def statuses_page(driver, base_url, seed_store, request):
     page = StatusesPage(driver, base_url)
-    page.delete_all_statuses()
+
+    def seed():
+        login_page = LoginPage(driver, base_url)
+        login_page.login(USER["login"], USER["password"])
+        page.delete_all_statuses()
+
+    seed_store.provide(request, driver, "statuses", seed)
     return page
 
 
 @pytest.fixture()
-def seeded_status(statuses_page):
-    name = f"Status {uuid.uuid4().hex[:5]}"
-    slug = f"slug-{uuid.uuid4().hex[:5]}"
-    assert statuses_page.create_status(name, slug)
-    return statuses_page, name, slug
+def seeded_status(statuses_page, driver, base_url, seed_store, request):
+    def seed():
+        name = f"Status {uuid.uuid4().hex[:5]}"
+        slug = f"slug-{uuid.uuid4().hex[:5]}"
+        assert statuses_page.create_status(name, slug)
+        return {"name": name, "slug": slug}
+
+    data = seed_store.provide(request, driver, "seeded_status", seed)
+    return statuses_page, data["name"], data["slug"]
 
 
 def test_create_status(statuses_page):
@@ -36,17 +44,20 @@ def test_view_statuses_list(statuses_page):
     statuses_page.wait_for_text("Slug")
 
 
+@pytest.mark.mutates_seed
 def test_edit_status(seeded_status):
     statuses_page, name, slug = seeded_status
     new_name = f"{name} Updated"
     assert statuses_page.edit_status(name, new_name)
 
 
+@pytest.mark.mutates_seed
 def test_delete_status(seeded_status):
     statuses_page, name, _ = seeded_status
     assert statuses_page.delete_status(name)
 
 
+@pytest.mark.mutates_seed
 def test_delete_all_statuses(seeded_status):
     statuses_page, name, _ = seeded_status
     assert statuses_page.delete_all_statuses()
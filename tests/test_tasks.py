@@ -10,34 +10,41 @@ from .pages.users import UsersPage
 
 
 @pytest.fixture()
-def tasks_setup(driver, base_url):
-    login_page = LoginPage(driver, base_url)
-    login_page.login(USER["login"], USER["password"])
-
-    statuses_page = StatusesPage(driver, base_url)
-    statuses_page.delete_all_statuses()
-    primary_status_name = f"Status {uuid.uuid4().hex[:5]}"
-    primary_status_slug = f"primary-{uuid.uuid4().hex[:5]}"
-    secondary_status_name = f"Status {uuid.uuid4().hex[:5]}"
-    secondary_status_slug = f"secondary-{uuid.uuid4().hex[:5]}"
-
-    assert statuses_page.create_status(primary_status_name, primary_status_slug)
-    assert statuses_page.create_status(secondary_status_name, secondary_status_slug)
-
-    users_page = UsersPage(driver, base_url)
-    email = f"tasker_{uuid.uuid4().hex[:5]}@example.com"
-    first_name = f"Tasker{uuid.uuid4().hex[:4]}"
-    last_name = "Tester"
-    assert users_page.create_user(email, first_name, last_name)
+def tasks_setup(driver, base_url, seed_store, request):
+    def seed():
+        login_page = LoginPage(driver, base_url)
+        login_page.login(USER["login"], USER["password"])
+
+        statuses_page = StatusesPage(driver, base_url)
+        statuses_page.delete_all_statuses()
+        primary_status_name = f"Status {uuid.uuid4().hex[:5]}"
+        primary_status_slug = f"primary-{uuid.uuid4().hex[:5]}"
+        secondary_status_name = f"Status {uuid.uuid4().hex[:5]}"
+        secondary_status_slug = f"secondary-{uuid.uuid4().hex[:5]}"
+
+        assert statuses_page.create_status(primary_status_name, primary_status_slug)
+        assert statuses_page.create_status(secondary_status_name, secondary_status_slug)
+
+        users_page = UsersPage(driver, base_url)
+        email = f"tasker_{uuid.uuid4().hex[:5]}@example.com"
+        first_name = f"Tasker{uuid.uuid4().hex[:4]}"
+        last_name = "Tester"
+        assert users_page.create_user(email, first_name, last_name)
+
+        return {
+            "assignee_email": email,
+            "status": primary_status_name,
+            "alt_status": secondary_status_name,
+        }
+
+    data = seed_store.provide(request, driver, "tasks", seed)
 
     tasks_page = TasksPage(driver, base_url)
     tasks_page.open_page()
 
     return {
         "page": tasks_page,
-        "assignee_email": email,
-        "status": primary_status_name,
-        "alt_status": secondary_status_name,
+        **data,
         "content": "Autogenerated_by_selenium",
     }
 
@@ -55,6 +62,7 @@ def test_create_task_shows_card(tasks_setup):
     assert ctx["page"].task_exists(title)
 
 
+@pytest.mark.mutates_seed
 def test_edit_task_updates_title(tasks_setup):
     ctx = tasks_setup
     original_title = f"Task_{uuid.uuid4().hex[:6]}"
@@ -84,6 +92,49 @@ def test_change_task_status_moves_card(tasks_setup):
     assert ctx["page"].is_task_in_status(title, ctx["alt_status"])
 
 
+def test_move_task_on_board(tasks_setup):
+    ctx = tasks_setup
+    titles = [f"Task_{uuid.uuid4().hex[:6]}" for _ in range(2)]
+
+    for title in titles:
+        assert ctx["page"].create_task(
+            title,
+            ctx["content"],
+            ctx["assignee_email"],
+            ctx["status"],
+        )
+    assert ctx["page"].move_task(titles[0], ctx["alt_status"])
+    assert all(ctx["page"].move_tasks({title: ctx["alt_status"] for title in titles[1:]}).values())
+    for title in titles:
+        assert ctx["page"].is_task_in_status(title, ctx["alt_status"])
+
+
+def test_board_tab_sees_edit_from_another_tab(tasks_setup, base_url, tabs):
+    ctx = tasks_setup
+    title = f"Task_{uuid.uuid4().hex[:6]}"
+
+    assert ctx["page"].create_task(
+        title,
+        ctx["content"],
+        ctx["assignee_email"],
+        ctx["status"],
+    )
+    editor = tabs.bind(ctx["page"])
+    board = tabs.open(TasksPage, base_url)
+
+    def edit():
+        yield editor.edit_task(title, new_status=ctx["alt_status"])
+
+    def watch():
+        yield board.open_page()
+        yield  # let the editor save first
+        # No reload: the board that was already open has to pick up the edit.
+        return board.wait_for_task_in_status(title, ctx["alt_status"])
+
+    _, moved = tabs.interleave(edit(), watch())
+    assert moved
+
+
 def test_view_task_details(tasks_setup):
     ctx = tasks_setup
     title = f"Task_{uuid.uuid4().hex[:6]}"
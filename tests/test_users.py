@@ -8,19 +8,27 @@ from .pages.users import UsersPage
 
 
 @pytest.fixture()
-def users_page(driver, base_url):
-    login_page = LoginPage(driver, base_url)
-    login_page.login(USER["login"], USER["password"])
+def users_page(driver, base_url, seed_store, request):
     page = UsersPage(driver, base_url)
-    page.delete_all_users()
+
+    def seed():
+        login_page = LoginPage(driver, base_url)
+        login_page.login(USER["login"], USER["password"])
+        page.delete_all_users()
+
+    seed_store.provide(request, driver, "users", seed)
     return page
 
 
 @pytest.fixture()
-def seeded_users_page(users_page):
-    email = f"user-{uuid.uuid4().hex[:6]}@example.com"
-    assert users_page.create_user(email, "Name", "Surname")
-    return users_page, email
+def seeded_users_page(users_page, driver, base_url, seed_store, request):
+    def seed():
+        email = f"user-{uuid.uuid4().hex[:6]}@example.com"
+        assert users_page.create_user(email, "Name", "Surname")
+        return {"email": email}
+
+    data = seed_store.provide(request, driver, "seeded_users", seed)
+    return users_page, data["email"]
 
 
 def test_create_user(users_page):
@@ -32,20 +40,23 @@ def test_view_user_list(seeded_users_page):
     users_page, email = seeded_users_page
     users_page.open_page()
     users_page.wait_for_text("Email")
-    users_page.wait_for_text(email)
+    assert users_page.locate(email) is not None
 
 
+@pytest.mark.mutates_seed
 def test_edit_user(seeded_users_page):
     users_page, email = seeded_users_page
     updated_name = "Updated Name"
     assert users_page.edit_user(email, updated_name)
 
 
+@pytest.mark.mutates_seed
 def test_delete_user(seeded_users_page):
     users_page, email = seeded_users_page
     assert users_page.delete_user(email)
 
 
+@pytest.mark.mutates_seed
 def test_delete_all_users(seeded_users_page):
     users_page, email = seeded_users_page
     assert users_page.delete_all_users()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from ..config import TestConfig
+
+
+def chrome_options(config: TestConfig) -> Options:
+    options = Options()
+    if config.headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    options.add_argument(f"--window-size={config.window_size}")
+    chrome_binary = os.getenv("CHROME_BIN", "/usr/bin/chromium")
+    if Path(chrome_binary).exists():
+        options.binary_location = chrome_binary
+    return options
+
+
+def new_browser(config: TestConfig, options: Options | None = None) -> webdriver.Chrome:
+    """Start a Chrome session with the config's timeouts (``options`` default to ``chrome_options``)."""
+    driver = webdriver.Chrome(options=options or chrome_options(config))
+    driver.set_page_load_timeout(config.page_load_timeout)
+    # Page objects look elements up through Wait only; an implicit wait would
+    # stall every empty find_elements inside a condition and every
+    # expected-negative lookup.
+    driver.implicitly_wait(0)
+    return driver
+
+
+__all__ = ["chrome_options", "new_browser"]
@@ -0,0 +1,66 @@
+"""Observe every WebDriver command a browser sends.
+
+``add_command_listener`` wraps the driver's ``execute`` once and fans each
+finished command out to the registered listeners, so tracing, recording and
+similar tools do not stack wrappers on top of each other.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+
+_listeners: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@dataclass(frozen=True, slots=True)
+class CommandEvent:
+    command: str
+    params: dict | None
+    started: float  # time.time() of the call
+    duration: float
+    response: dict | None
+    error: BaseException | None
+
+
+CommandListener = Callable[[CommandEvent], None]
+
+
+def add_command_listener(driver, listener: CommandListener) -> None:
+    listeners = _listeners.get(driver)
+    if listeners is None:
+        listeners = _listeners[driver] = []
+        _install(driver, listeners)
+    listeners.append(listener)
+
+
+def remove_command_listener(driver, listener: CommandListener) -> None:
+    listeners = _listeners.get(driver)
+    if listeners and listener in listeners:
+        listeners.remove(listener)
+
+
+def _install(driver, listeners: list[CommandListener]) -> None:
+    execute = driver.execute
+
+    def traced_execute(driver_command: str, params: dict | None = None):
+        started = time.time()
+        clock = time.perf_counter()
+        response = error = None
+        try:
+            response = execute(driver_command, params)
+            return response
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            event = CommandEvent(driver_command, params, started, time.perf_counter() - clock, response, error)
+            for listener in listeners:
+                listener(event)
+
+    driver.execute = traced_execute
+
+
+__all__ = ["CommandEvent", "CommandListener", "add_command_listener", "remove_command_listener"]
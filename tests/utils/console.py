@@ -0,0 +1,106 @@
+"""Browser console messages and uncaught JS errors, streamed over WebDriver BiDi.
+
+The browser pushes ``log.entryAdded`` events over the BiDi websocket as they
+happen; handlers only append to a bounded buffer, so page-object steps make
+no extra round-trips.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.console")
+
+DEFAULT_CAPACITY = 500
+LEVELS = {"debug": 10, "info": 20, "warn": 30, "warning": 30, "error": 40}
+FAIL_LEVELS = {"off", "warning", "error"}
+
+
+def enable_bidi(options) -> None:
+    options.enable_bidi = True
+
+
+@dataclass(frozen=True, slots=True)
+class ConsoleEntry:
+    kind: str  # "console" or "javascript"
+    level: str
+    text: str
+    timestamp: float  # ms since the epoch, as reported by the browser
+    location: str | None = None
+
+    @property
+    def severity(self) -> int:
+        return LEVELS.get(self.level.lower(), LEVELS["info"])
+
+    def format(self) -> str:
+        moment = datetime.fromtimestamp(self.timestamp / 1000, UTC).strftime("%H:%M:%S.%f")[:-3]
+        source = "uncaught" if self.kind == "javascript" else "console"
+        suffix = f"  ({self.location})" if self.location else ""
+        return f"{moment} {self.level.upper():<7} {source}: {self.text}{suffix}"
+
+
+def _top_frame(stacktrace: dict | None) -> str | None:
+    frames = (stacktrace or {}).get("callFrames") or []
+    if not frames:
+        return None
+    frame = frames[0]
+    return f"{frame.get('url', '?')}:{frame.get('lineNumber', 0) + 1}:{frame.get('columnNumber', 0) + 1}"
+
+
+class ConsoleCapture:
+    """Bounded buffer of one browser's console output."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._entries: deque[ConsoleEntry] = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def attach(self, driver) -> bool:
+        """Subscribe to the browser's log events; ``False`` if the session has no BiDi."""
+        try:
+            driver.script.add_console_message_handler(self._on_console)
+            driver.script.add_javascript_error_handler(self._on_error)
+        except Exception as error:  # noqa: BLE001
+            logger.warning("Console capture unavailable: %s", error)
+            return False
+        return True
+
+    def _append(self, entry: ConsoleEntry) -> None:
+        # Runs on the websocket thread; deque.append is atomic.
+        if len(self._entries) == self._entries.maxlen:
+            self.dropped += 1
+        self._entries.append(entry)
+
+    def _on_console(self, event) -> None:
+        self._append(ConsoleEntry("console", event.level, event.text, float(event.timestamp)))
+
+    def _on_error(self, event) -> None:
+        self._append(
+            ConsoleEntry("javascript", "error", event.text, float(event.timestamp), _top_frame(event.stacktrace)),
+        )
+
+    def clear(self) -> None:
+        """Start a new test on a reused browser."""
+        self._entries.clear()
+        self.dropped = 0
+
+    @property
+    def entries(self) -> list[ConsoleEntry]:
+        return list(self._entries)
+
+    def at_or_above(self, level: str) -> list[ConsoleEntry]:
+        threshold = LEVELS[level]
+        return [entry for entry in self.entries if entry.severity >= threshold]
+
+    def format(self) -> str:
+        lines = [entry.format() for entry in self.entries]
+        if self.dropped:
+            lines.insert(0, f"... {self.dropped} older entries dropped")
+        return "\n".join(lines)
+
+
+__all__ = ["ConsoleCapture", "ConsoleEntry", "DEFAULT_CAPACITY", "FAIL_LEVELS", "enable_bidi"]
@@ -1,14 +1,104 @@
 from __future__ import annotations
 
+import copy
+import functools
+import json
 import logging
+import os
+import queue
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_DATE_FORMAT = "%H:%M:%S"
 LOGGER_NAME = "hexlet.kanban"
 
+_current_test: ContextVar[str | None] = ContextVar("current_test", default=None)
+_listener: QueueListener | None = None
+
+
+def worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def set_current_test(nodeid: str | None) -> None:
+    _current_test.set(nodeid)
+
+
+def current_test() -> str | None:
+    return _current_test.get()
+
+
+class ContextFilter(logging.Filter):
+    """Stamp records with the running test and worker before they leave the caller."""
+
+    def __init__(self, worker: str):
+        super().__init__()
+        self.worker = worker
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.nodeid = _current_test.get()
+        record.worker = self.worker
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, suitable for ``jq`` and log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "nodeid": getattr(record, "nodeid", None),
+            "worker": getattr(record, "worker", None),
+        }
+        for field in ("action", "duration"):
+            value = getattr(record, field, None)
+            if value is not None:
+                payload[field] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue records with the traceback in ``exc_text`` rather than folded into the message.
+
+    The stock ``prepare`` appends the traceback to ``msg``, which would leave
+    JSON lines without their ``exc_info`` field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+def configure_logging(
+    level: str,
+    log_dir: Path | None = None,
+    *,
+    use_queue: bool = False,
+    json_lines: bool = False,
+    max_bytes: int = 0,
+    backup_count: int = 0,
+) -> logging.Logger:
+    global _listener
 
-def configure_logging(level: str, log_dir: Path | None = None) -> logging.Logger:
     logger = logging.getLogger(LOGGER_NAME)
 
     if logger.handlers:
@@ -19,15 +109,85 @@ def configure_logging(level: str, log_dir: Path | None = None) -> logging.Logger
     logger.setLevel(level)
 
     if log_dir:
+        worker = worker_id()
         log_dir.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_dir / "pytest.log", mode="w", encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+        suffix = "jsonl" if json_lines else "log"
+        name = "pytest" if worker == "main" else f"pytest-{worker}"
+        file_handler = RotatingFileHandler(
+            log_dir / f"{name}.{suffix}",
+            mode="w",
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+        )
+        formatter = JsonFormatter() if json_lines else logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+        file_handler.setFormatter(formatter)
         file_handler.setLevel(level)
-        logger.addHandler(file_handler)
+        if max_bytes and file_handler.stream.tell():
+            # Size rotation appends, so roll the previous run out of the way first.
+            file_handler.doRollover()
+
+        if use_queue:
+            records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            queue_handler = ContextQueueHandler(records)
+            # The filter must run on the caller's thread to see the current test.
+            queue_handler.addFilter(ContextFilter(worker))
+            logger.addHandler(queue_handler)
+            _listener = QueueListener(records, file_handler, respect_handler_level=True)
+            _listener.start()
+        else:
+            file_handler.addFilter(ContextFilter(worker))
+            logger.addHandler(file_handler)
 
     # Keep propagation enabled so that pytest's log capture/CLI handlers work.
     return logger
 
 
-__all__ = ["configure_logging", "LOGGER_NAME", "LOG_FORMAT", "LOG_DATE_FORMAT"]
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener, if any."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_action(logger: logging.Logger, action: str):
+    """Decorate a page-object step so its duration lands in the structured log at DEBUG."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = round(time.perf_counter() - started, 4)
+                logger.debug(
+                    "%s finished in %.3fs",
+                    action,
+                    duration,
+                    extra={"action": action, "duration": duration},
+                )
+
+        return wrapper
+
+    return decorator
+
 
+__all__ = [
+    "ContextFilter",
+    "ContextQueueHandler",
+    "JsonFormatter",
+    "LOGGER_NAME",
+    "LOG_DATE_FORMAT",
+    "LOG_FORMAT",
+    "configure_logging",
+    "current_test",
+    "log_action",
+    "set_current_test",
+    "shutdown_logging",
+    "worker_id",
+]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True, slots=True)
+class Target:
+    name: str
+    implementation: str | None
+    base_url: str
+
+
+def _split(value: str | None) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def matrix_targets() -> list[Target]:
+    """Targets from ``IMPLEMENTATIONS`` and ``APP_BASE_URLS`` (comma separated lists)."""
+    targets = [
+        Target(name=implementation, implementation=implementation, base_url=f"http://{implementation}.test")
+        for implementation in _split(os.getenv("IMPLEMENTATIONS"))
+    ]
+    for base_url in _split(os.getenv("APP_BASE_URLS")):
+        netloc = urlparse(base_url).netloc or "custom"
+        targets.append(
+            Target(name=re.sub(r"[^\w.-]", "_", netloc), implementation=None, base_url=base_url),
+        )
+
+    names = [target.name for target in targets]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise RuntimeError(f"Matrix targets must be unique, duplicated: {', '.join(duplicates)}")
+    return targets
+
+
+class MatrixResults:
+    """Outcome and duration of every test call, per target."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.results: dict[str, dict[str, tuple[str, float]]] = defaultdict(dict)
+
+    def record(self, target: str, test: str, outcome: str, duration: float) -> None:
+        with self._lock:
+            self.results[target][test] = (outcome, duration)
+
+    def summary_lines(self) -> list[str]:
+        targets = sorted(self.results)
+        if not targets:
+            return []
+
+        lines = [f"{'target':<32}{'passed':>8}{'failed':>8}{'skipped':>9}{'time, s':>10}"]
+        for target in targets:
+            outcomes = [outcome for outcome, _ in self.results[target].values()]
+            total = sum(duration for _, duration in self.results[target].values())
+            lines.append(
+                f"{target:<32}{outcomes.count('passed'):>8}{outcomes.count('failed'):>8}"
+                f"{outcomes.count('skipped'):>9}{total:>10.1f}",
+            )
+
+        tests = sorted({test for results in self.results.values() for test in results})
+        width = max(len(test) for test in tests) + 2
+        lines.append("")
+        lines.append(f"{'test':<{width}}" + "".join(f"{target[:16]:>18}" for target in targets))
+        for test in tests:
+            cells = []
+            for target in targets:
+                outcome, duration = self.results[target].get(test, ("-", 0.0))
+                cells.append(f"{outcome[:4]} {duration:6.1f}s" if outcome != "-" else "-")
+            lines.append(f"{test:<{width}}" + "".join(f"{cell:>18}" for cell in cells))
+        return lines
+
+
+__all__ = ["MatrixResults", "Target", "matrix_targets"]
@@ -0,0 +1,99 @@
+"""JS heap, DOM node and event-listener growth per test, via CDP ``Performance.getMetrics``."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.memory")
+
+# CDP metric name -> (report name, scale)
+METRICS = {
+    "JSHeapUsedSize": ("js_heap_mb", 1 / 1048576),
+    "Nodes": ("dom_nodes", 1),
+    "JSEventListeners": ("listeners", 1),
+    "Documents": ("documents", 1),
+}
+
+_enabled: weakref.WeakSet = weakref.WeakSet()
+
+
+def sample(driver) -> dict[str, float]:
+    """Current metrics of the browser's page; enables the CDP domain on first use."""
+    if driver not in _enabled:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        _enabled.add(driver)
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+    values = {}
+    for metric in metrics:
+        if metric.get("name") in METRICS:
+            name, scale = METRICS[metric["name"]]
+            values[name] = round(metric["value"] * scale, 2)
+    return values
+
+
+def delta(before: dict[str, float], after: dict[str, float]) -> dict[str, float]:
+    return {name: round(after[name] - before.get(name, 0.0), 2) for name in after}
+
+
+@dataclass(frozen=True, slots=True)
+class RecyclePolicy:
+    """Growth over a browser's first sample at which it is replaced."""
+
+    js_heap_mb: float
+    dom_nodes: float
+    listeners: float
+
+    def reason(self, baseline: dict[str, float], current: dict[str, float]) -> str | None:
+        growth = delta(baseline, current)
+        for name in ("js_heap_mb", "dom_nodes", "listeners"):
+            limit = getattr(self, name)
+            if limit and growth.get(name, 0.0) > limit:
+                return f"{name} grew by {growth[name]:g} (limit {limit:g})"
+        return None
+
+
+class MemoryReport:
+    """Per-test deltas and browser recycles, ranked by heap growth at the end of the session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tests: dict[str, dict] = {}
+        self.recycles: list[dict] = []
+
+    def record(self, nodeid: str, before: dict[str, float], after: dict[str, float], *, browser_tests: int) -> None:
+        with self._lock:
+            self.tests[nodeid] = {
+                "delta": delta(before, after),
+                "after": after,
+                "browser_tests": browser_tests,
+            }
+
+    def record_recycle(self, nodeid: str, reason: str, browser_tests: int) -> None:
+        logger.info("Recycling browser after %s (%d tests): %s", nodeid, browser_tests, reason)
+        with self._lock:
+            self.recycles.append({"after_test": nodeid, "reason": reason, "browser_tests": browser_tests})
+
+    def ranked(self) -> list[tuple[str, dict]]:
+        with self._lock:
+            return sorted(
+                self.tests.items(),
+                key=lambda item: item[1]["delta"].get("js_heap_mb", 0.0),
+                reverse=True,
+            )
+
+    def write(self, path: Path) -> None:
+        if not self.tests:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"tests": dict(self.ranked()), "recycles": self.recycles}
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+__all__ = ["METRICS", "MemoryReport", "RecyclePolicy", "delta", "sample"]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import weakref
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+
+PERFORMANCE_LOG = "performance"
+DEFAULT_CAPACITY = 5000
+
+_TRACKED_EVENTS = {
+    "Network.requestWillBeSent",
+    "Network.responseReceived",
+    "Network.loadingFinished",
+    "Network.loadingFailed",
+}
+
+
+def enable_performance_logging(options) -> None:
+    """Ask chromedriver to record DevTools network events into the performance log."""
+    options.set_capability("goog:loggingPrefs", {PERFORMANCE_LOG: "ALL"})
+    options.add_experimental_option(
+        "perfLoggingPrefs",
+        {"enableNetwork": True, "enablePage": False},
+    )
+
+
+class NetworkTrace:
+    """Ring buffer with the most recent network events of a single test.
+
+    ``collect`` drains chromedriver's performance log into the buffer. Pages
+    call it before every navigation (see ``trace_for``), so chromedriver only
+    holds the events of the current route and memory stays bounded by the
+    capacity. That costs one log round trip per navigation even on passing
+    tests, which is why tracing is opt-in (``NETWORK_TRACE``). ``start``
+    discards what the browser logged before the test, e.g. for earlier tests
+    of a reused browser.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._events: deque[dict] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def start(self, driver) -> None:
+        driver.get_log(PERFORMANCE_LOG)
+        self._events.clear()
+
+    def collect(self, driver) -> None:
+        for entry in driver.get_log(PERFORMANCE_LOG):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get("method") in _TRACKED_EVENTS:
+                self._events.append(message)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def to_har(self) -> dict:
+        requests: dict[str, dict] = {}
+        for event in self._events:
+            params = event.get("params", {})
+            request_id = params.get("requestId")
+            if request_id is None:
+                continue
+            method = event["method"]
+            if method == "Network.requestWillBeSent":
+                requests[request_id] = {
+                    "started": params.get("timestamp"),
+                    "wall_time": params.get("wallTime"),
+                    "request": params.get("request", {}),
+                }
+                continue
+
+            record = requests.get(request_id)
+            if record is None:
+                # The request started before the oldest event kept in the buffer.
+                continue
+            if method == "Network.responseReceived":
+                record["response"] = params.get("response", {})
+            elif method == "Network.loadingFinished":
+                record["finished"] = params.get("timestamp")
+                record["size"] = params.get("encodedDataLength")
+            elif method == "Network.loadingFailed":
+                record["finished"] = params.get("timestamp")
+                record["error"] = params.get("errorText")
+
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "hexlet-kanban-tests", "version": "1.0"},
+                "entries": [
+                    _to_har_entry(request_id, record)
+                    for request_id, record in requests.items()
+                ],
+            },
+        }
+
+    def dump(self, path: Path) -> Path:
+        path.write_text(json.dumps(self.to_har(), indent=2), encoding="utf-8")
+        return path
+
+
+_traces: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def attach(driver, trace: NetworkTrace) -> None:
+    _traces[driver] = trace
+
+
+def trace_for(driver) -> NetworkTrace | None:
+    try:
+        return _traces.get(driver)
+    except TypeError:
+        return None
+
+
+def _to_har_entry(request_id: str, record: dict) -> dict:
+    request = record["request"]
+    response = record.get("response", {})
+    started = record.get("started")
+    finished = record.get("finished")
+    duration_ms = (finished - started) * 1000 if started is not None and finished else -1
+
+    wall_time = record.get("wall_time")
+    started_at = (
+        datetime.fromtimestamp(wall_time, tz=UTC).isoformat() if wall_time else None
+    )
+
+    entry = {
+        "_requestId": request_id,
+        "startedDateTime": started_at,
+        "time": round(duration_ms, 3),
+        "request": {
+            "method": request.get("method"),
+            "url": request.get("url"),
+        },
+        "response": {
+            "status": response.get("status"),
+            "statusText": response.get("statusText"),
+            "mimeType": response.get("mimeType"),
+            "bodySize": record.get("size", -1),
+        },
+        "timings": _timings(response.get("timing")),
+    }
+    if "error" in record:
+        entry["_error"] = record["error"]
+    return entry
+
+
+def _timings(timing: dict | None) -> dict:
+    if not timing:
+        return {}
+    return {
+        "dns": _span(timing, "dnsStart", "dnsEnd"),
+        "connect": _span(timing, "connectStart", "connectEnd"),
+        "ssl": _span(timing, "sslStart", "sslEnd"),
+        "send": _span(timing, "sendStart", "sendEnd"),
+        "wait": _span(timing, "sendEnd", "receiveHeadersEnd"),
+    }
+
+
+def _span(timing: dict, start: str, end: str) -> float:
+    begin, finish = timing.get(start, -1), timing.get(end, -1)
+    if begin < 0 or finish < 0:
+        return -1
+    return round(finish - begin, 3)
+
+
+__all__ = ["DEFAULT_CAPACITY", "NetworkTrace", "attach", "enable_performance_logging", "trace_for"]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import time
+import weakref
+from pathlib import Path
+
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.perf")
+
+MODES = {"off", "warn", "fail"}
+
+# Runs right before navigating. Hash routes are same-document navigations, so
+# the mark survives them; a full page load discards it.
+START_SCRIPT = """
+performance.clearMarks("kanban:route-start");
+performance.clearMeasures("kanban:route");
+performance.mark("kanban:route-start");
+if (window.__kanbanPerf) window.__kanbanPerf.longTasks.length = 0;
+"""
+
+# Runs once the route is ready: installs the long-task observer on first use
+# and returns what the route cost. Navigation and paint entries describe the
+# document load, so they are reported only when the route loaded a new document.
+COLLECT_SCRIPT = """
+const state = window.__kanbanPerf || (window.__kanbanPerf = {longTasks: []});
+if (!state.observer && window.PerformanceObserver) {
+  try {
+    state.observer = new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) state.longTasks.push(entry.duration);
+    });
+    state.observer.observe({type: "longtask", buffered: true});
+  } catch (error) {
+    state.observer = null;
+  }
+}
+const start = performance.getEntriesByName("kanban:route-start", "mark").pop();
+const measure = start ? performance.measure("kanban:route", "kanban:route-start") : null;
+const nav = start ? null : performance.getEntriesByType("navigation")[0];
+const paint = {};
+if (!start) {
+  for (const entry of performance.getEntriesByType("paint")) paint[entry.name] = entry.startTime;
+}
+const longTasks = state.longTasks.splice(0);
+return {
+  route_load_ms: measure ? measure.duration : performance.now(),
+  document_load: !start,
+  ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+  dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+  load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+  first_paint_ms: paint["first-paint"] ?? null,
+  first_contentful_paint_ms: paint["first-contentful-paint"] ?? null,
+  long_task_count: longTasks.length,
+  long_task_ms: longTasks.reduce((total, value) => total + value, 0),
+  js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+};
+"""
+
+DEFAULT_BUDGETS: dict[str, dict[str, float]] = {
+    "*": {
+        "route_load_ms": 3000,
+        "first_contentful_paint_ms": 2500,
+        "dom_content_loaded_ms": 3000,
+        "long_task_ms": 500,
+        "js_heap_mb": 150,
+    },
+}
+
+_monitors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def load_budgets(path: Path | None) -> dict[str, dict[str, float]]:
+    """Merge per-route budgets from a JSON file over the defaults.
+
+    The file maps a route (``tasks``, ``users``, ``labels``, ``task_statuses``,
+    ``login``) or ``*`` to metric limits, e.g. ``{"tasks": {"long_task_ms": 200}}``.
+    """
+    budgets = {route: dict(limits) for route, limits in DEFAULT_BUDGETS.items()}
+    if path is None:
+        return budgets
+    for route, limits in json.loads(path.read_text(encoding="utf-8")).items():
+        budgets.setdefault(route, {}).update(limits)
+    return budgets
+
+
+class PerfMonitor:
+    """Collects browser-side timings per route and checks them against budgets."""
+
+    def __init__(self, budgets: dict[str, dict[str, float]], mode: str = "warn"):
+        self.budgets = budgets
+        self.mode = mode
+        self.samples: dict[str, list[dict]] = {}
+        self.violations: list[str] = []
+
+    def start_test(self) -> None:
+        self.violations = []
+
+    def limits_for(self, route: str) -> dict[str, float]:
+        return {**self.budgets.get("*", {}), **self.budgets.get(route, {})}
+
+    def begin_route(self, driver) -> None:
+        try:
+            driver.execute_script(START_SCRIPT)
+        except Exception as error:  # noqa: BLE001
+            logger.debug("Could not mark the route start: %s", error)
+
+    def record(self, driver, route: str, elapsed_ms: float) -> dict:
+        """Collect the route's metrics; ``elapsed_ms`` is used when the browser cannot time it."""
+        try:
+            metrics = driver.execute_script(COLLECT_SCRIPT) or {}
+        except Exception as error:  # noqa: BLE001
+            logger.debug("Could not read performance entries for %s: %s", route, error)
+            metrics = {}
+        metrics.setdefault("route_load_ms", elapsed_ms)
+        metrics["timestamp"] = time.time()
+        self.samples.setdefault(route, []).append(metrics)
+
+        for metric, limit in self.limits_for(route).items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                self.violations.append(f"{route}: {metric}={value:.1f} exceeds budget {limit}")
+        return metrics
+
+    def write_trend(self, target_dir: Path) -> None:
+        """Append one summary line per route so runs can be compared over time."""
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for route, samples in self.samples.items():
+            summary = {"timestamp": time.time(), "samples": len(samples)}
+            for metric in self.limits_for(route):
+                values = [sample[metric] for sample in samples if sample.get(metric) is not None]
+                if values:
+                    summary[metric] = round(statistics.median(values), 2)
+            with (target_dir / f"{route}.jsonl").open("a", encoding="utf-8") as trend:
+                trend.write(json.dumps(summary) + "\n")
+
+
+def attach(driver, monitor: PerfMonitor) -> None:
+    _monitors[driver] = monitor
+
+
+def monitor_for(driver) -> PerfMonitor | None:
+    try:
+        return _monitors.get(driver)
+    except TypeError:
+        return None
+
+
+__all__ = [
+    "DEFAULT_BUDGETS",
+    "MODES",
+    "PerfMonitor",
+    "attach",
+    "load_budgets",
+    "monitor_for",
+]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class PooledBrowser:
+    """A browser plus what is attached to it once per browser rather than per test."""
+
+    driver: object
+    console: object | None = None
+    baseline: dict[str, float] | None = None
+    tests: int = 0
+
+
+class BrowserPool:
+    """Keeps one idle browser per worker (and matrix target) between tests."""
+
+    def __init__(self, launch: Callable[[], PooledBrowser]):
+        self._launch = launch
+        self._idle: PooledBrowser | None = None
+
+    def acquire(self) -> PooledBrowser:
+        browser, self._idle = self._idle, None
+        return browser if browser is not None else self._launch()
+
+    def release(self, browser: PooledBrowser, *, keep: bool) -> None:
+        browser.tests += 1
+        if keep:
+            self._idle = browser
+        else:
+            browser.driver.quit()
+
+    def close(self) -> None:
+        if self._idle is not None:
+            self._idle.driver.quit()
+            self._idle = None
+
+
+__all__ = ["BrowserPool", "PooledBrowser"]
@@ -0,0 +1,94 @@
+"""Session-start check that the app answers before any browser is launched."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import RetryError, Retrying, retry_if_result, stop_after_delay, wait_exponential
+
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.readiness")
+
+REQUEST_TIMEOUT = 5.0
+MAX_INTERVAL = 5.0
+
+
+class AppNotReadyError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    url: str
+    status: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        # The API root may well answer 404; anything below 500 means a server is up.
+        return self.status is not None and self.status < 500
+
+    def describe(self) -> str:
+        return f"{self.url}: HTTP {self.status}" if self.status is not None else f"{self.url}: {self.error}"
+
+
+class ReadinessProbe:
+    """Poll every URL over one pooled session with exponential backoff until all respond."""
+
+    def __init__(self, urls: list[str], *, timeout: float, request_timeout: float = REQUEST_TIMEOUT):
+        self.urls = urls
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(urls), pool_maxsize=len(urls))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.attempts = 0
+
+    def _check(self, url: str) -> ProbeResult:
+        try:
+            response = self.session.get(url, timeout=self.request_timeout, allow_redirects=True)
+        except requests.RequestException as error:
+            return ProbeResult(url, error=f"{type(error).__name__}: {error}")
+        return ProbeResult(url, status=response.status_code)
+
+    def _attempt(self) -> list[ProbeResult]:
+        self.attempts += 1
+        results = [self._check(url) for url in self.urls]
+        pending = [result for result in results if not result.ok]
+        if pending:
+            logger.debug("Attempt %d: waiting for %s", self.attempts, "; ".join(map(ProbeResult.describe, pending)))
+        return results
+
+    def wait(self) -> float:
+        """Block until every URL responds; return the time it took.
+
+        Raises ``AppNotReadyError`` with the last result of every URL on timeout.
+        """
+        started = time.monotonic()
+        retrying = Retrying(
+            stop=stop_after_delay(self.timeout),
+            wait=wait_exponential(multiplier=0.25, max=MAX_INTERVAL),
+            retry=retry_if_result(lambda results: not all(result.ok for result in results)),
+        )
+        try:
+            retrying(self._attempt)
+        except RetryError as error:
+            results = error.last_attempt.result()
+            lines = "\n".join(f"  {result.describe()}" for result in results)
+            raise AppNotReadyError(
+                f"App did not become ready within {self.timeout:.0f}s ({self.attempts} attempts):\n{lines}",
+            ) from None
+        finally:
+            self.session.close()
+        elapsed = time.monotonic() - started
+        logger.info("App ready after %.2fs (%d attempts): %s", elapsed, self.attempts, ", ".join(self.urls))
+        return elapsed
+
+
+__all__ = ["AppNotReadyError", "ProbeResult", "ReadinessProbe"]
@@ -0,0 +1,130 @@
+"""Record a test's WebDriver commands for offline replay (``python -m tests.replay``).
+
+Each command is stored with its parameters, response value, duration and
+offset from the start of the test. After navigations and clicks the recorder
+also stores a static snapshot of the page: the DOM without scripts, with
+stylesheets and form values inlined, so the replay can run against a local
+copy instead of the real app. Identical snapshots are stored once, and the
+file is gzipped JSON.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+
+from .commands import CommandEvent, add_command_listener, remove_command_listener
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.recorder")
+
+FORMAT_VERSION = 1
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+SNAPSHOT_AFTER = {"get", "clickElement"}
+# Longer strings (screenshots, page sources) are stored as their length only.
+VALUE_LIMIT = 4096
+TRUNCATED_KEY = "__truncated__"
+
+_SNAPSHOT_SCRIPT = """
+const root = document.documentElement.cloneNode(true);
+const live = document.querySelectorAll('style, link[rel="stylesheet"]');
+const copies = root.querySelectorAll('style, link[rel="stylesheet"]');
+live.forEach((node, index) => {
+  let rules;
+  try {
+    rules = Array.from(node.sheet.cssRules, (rule) => rule.cssText).join('\\n');
+  } catch (error) {
+    return;
+  }
+  const style = document.createElement('style');
+  style.textContent = rules;
+  copies[index].replaceWith(style);
+});
+const fields = document.querySelectorAll('input, textarea');
+root.querySelectorAll('input, textarea').forEach((field, index) => {
+  field.setAttribute('value', fields[index].value);
+});
+root.querySelectorAll('script').forEach((script) => script.remove());
+return [location.href, '<!DOCTYPE html>' + root.outerHTML];
+"""
+
+
+def compact(value):
+    if isinstance(value, str) and len(value) > VALUE_LIMIT:
+        return {TRUNCATED_KEY: len(value)}
+    if isinstance(value, dict):
+        return {key: compact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact(item) for item in value]
+    return value
+
+
+class CommandRecorder:
+    """Listens to one browser's commands from construction until ``stop``."""
+
+    def __init__(self, driver, test: str):
+        self.driver = driver
+        self.test = test
+        self._started = time.time()
+        self._commands: list[dict] = []
+        self._snapshots: dict[str, str] = {}
+        self._capturing = False
+        add_command_listener(driver, self._on_command)
+
+    def _on_command(self, event: CommandEvent) -> None:
+        if self._capturing:
+            return
+        params = {key: value for key, value in (event.params or {}).items() if key != "sessionId"}
+        self._commands.append({
+            "at": round(event.started - self._started, 4),
+            "command": event.command,
+            "params": compact(params),
+            "ms": round(event.duration * 1000, 2),
+            "value": compact((event.response or {}).get("value")),
+            "error": type(event.error).__name__ if event.error is not None else None,
+        })
+        if event.error is None and event.command in SNAPSHOT_AFTER:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        # The snapshot script is itself a command; keep it out of the recording.
+        self._capturing = True
+        try:
+            url, html = self.driver.execute_script(_SNAPSHOT_SCRIPT)
+        except Exception as error:  # noqa: BLE001
+            logger.debug("Page snapshot failed: %s", error)
+            return
+        finally:
+            self._capturing = False
+        key = hashlib.sha1(html.encode("utf-8")).hexdigest()[:16]
+        self._snapshots.setdefault(key, html)
+        self._commands.append({"snapshot": key, "url": url})
+
+    def stop(self, path: Path) -> Path:
+        remove_command_listener(self.driver, self._on_command)
+        recording = {
+            "version": FORMAT_VERSION,
+            "test": self.test,
+            "commands": self._commands,
+            "snapshots": self._snapshots,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as stream:
+            json.dump(recording, stream, separators=(",", ":"))
+        logger.debug("Recorded %d commands of %s to %s", len(self._commands), self.test, path)
+        return path
+
+
+def load_recording(path: Path) -> dict:
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        recording = json.load(stream)
+    if recording.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} has recording format {recording.get('version')}, expected {FORMAT_VERSION}")
+    return recording
+
+
+__all__ = ["CommandRecorder", "ELEMENT_KEY", "TRUNCATED_KEY", "compact", "load_recording"]
@@ -0,0 +1,152 @@
+"""Fingerprint-based reuse of passing results between runs.
+
+A test's fingerprint covers its module source, every ``tests`` module it
+reaches through imports (page objects, utils), the root ``conftest.py``, the
+resolved configuration together with the files it points at (perf budgets),
+other data inputs such as visual baselines and the ``APP_BUILD_ID`` of the app
+being tested. If the fingerprint equals the one stored for its last pass, the
+test can be skipped.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import sys
+import types
+from collections.abc import Iterable
+from pathlib import Path
+
+PACKAGE = "tests"
+
+
+def app_build_id() -> str | None:
+    """The ``APP_BUILD_ID`` of the app under test (e.g. an image digest), or ``None``.
+
+    There is no fallback: the dev server's index page stays the same across
+    app changes, so only an explicit identifier makes a cached pass trustworthy.
+    """
+    return os.getenv("APP_BUILD_ID") or None
+
+
+def _local_modules(module: types.ModuleType) -> list[types.ModuleType]:
+    """The module plus every ``tests`` module reachable through its globals."""
+    seen: dict[str, types.ModuleType] = {module.__name__: module}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        for value in vars(current).values():
+            if isinstance(value, types.ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+            if not isinstance(name, str) or name in seen:
+                continue
+            if name != PACKAGE and not name.startswith(f"{PACKAGE}."):
+                continue
+            dependency = sys.modules.get(name)
+            if dependency is not None:
+                seen[name] = dependency
+                pending.append(dependency)
+    return sorted(seen.values(), key=lambda item: item.__name__)
+
+
+def _files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted(child for child in path.rglob("*") if child.is_file())
+    return [path] if path.is_file() else []
+
+
+def _files_digest(paths: Iterable[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        for file in _files(path):
+            digest.update(str(file).encode())
+            digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _source_digest(module: types.ModuleType) -> str:
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        return ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path: Path, conftest_source: str, inputs: Iterable[Path] = ()):
+        self.path = path
+        self._conftest = hashlib.sha256(conftest_source.encode()).hexdigest()
+        self._inputs = tuple(inputs)
+        self._file_digests: dict[tuple[Path, ...], str] = {}
+        self._module_digests: dict[str, str] = {}
+        try:
+            self.passed: dict[str, str] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.passed = {}
+        self.fingerprints: dict[str, str] = {}
+        self.reused: list[str] = []
+        self._changes: dict[str, str | None] = {}
+
+    def _module_digest(self, module: types.ModuleType) -> str:
+        if module.__name__ not in self._module_digests:
+            self._module_digests[module.__name__] = _source_digest(module)
+        return self._module_digests[module.__name__]
+
+    def _data_digest(self, config) -> str:
+        """Contents of the configured files and the extra inputs, hashed once per set."""
+        configured = (getattr(config, field.name) for field in dataclasses.fields(config))
+        paths = (
+            *(value for value in configured if isinstance(value, Path) and value.is_file()),
+            *self._inputs,
+        )
+        if paths not in self._file_digests:
+            self._file_digests[paths] = _files_digest(paths)
+        return self._file_digests[paths]
+
+    def fingerprint(self, nodeid: str, module: types.ModuleType, config, build_id: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(nodeid.encode())
+        digest.update(self._conftest.encode())
+        digest.update(build_id.encode())
+        digest.update(json.dumps(dataclasses.asdict(config), default=str, sort_keys=True).encode())
+        digest.update(self._data_digest(config).encode())
+        for dependency in _local_modules(module):
+            digest.update(dependency.__name__.encode())
+            digest.update(self._module_digest(dependency).encode())
+        return digest.hexdigest()
+
+    def is_reusable(self, nodeid: str, fingerprint: str) -> bool:
+        return self.passed.get(nodeid) == fingerprint
+
+    def record_pass(self, nodeid: str) -> None:
+        fingerprint = self.fingerprints.get(nodeid)
+        if fingerprint is not None:
+            self._changes[nodeid] = fingerprint
+
+    def forget(self, nodeid: str) -> None:
+        self._changes[nodeid] = None
+
+    def save(self) -> None:
+        """Apply this process's changes on top of the stored file (workers share it)."""
+        if not self._changes:
+            return
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stored = {}
+        for nodeid, fingerprint in self._changes.items():
+            if fingerprint is None:
+                stored.pop(nodeid, None)
+            else:
+                stored[nodeid] = fingerprint
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(stored, indent=1, sort_keys=True), encoding="utf-8")
+        self._changes = {}
+
+
+__all__ = ["ResultCache", "app_build_id"]
@@ -0,0 +1,141 @@
+"""Step-level retries for transient WebDriver errors, with a per-test budget.
+
+A page-object action decorated with ``retry_step`` is re-run in the same
+browser when it hits a stale element or an intercepted click. Every test may
+spend at most ``STEP_RETRY_BUDGET`` retries; once it is used up errors
+propagate as before, so a broken page still fails quickly. Each retry is
+recorded in ``LEDGER``, which the quarantine report is built from.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+)
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from ..constants import STEP_RETRY_ATTEMPTS, STEP_RETRY_BUDGET
+from .logging import LOGGER_NAME, current_test
+
+logger = logging.getLogger(f"{LOGGER_NAME}.retries")
+
+TRANSIENT_ERRORS = (StaleElementReferenceException, ElementClickInterceptedException)
+
+
+class RetryLedger:
+    """Retries per test (for the budget) and per action (for the report)."""
+
+    def __init__(self, budget: int = STEP_RETRY_BUDGET):
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._spent: dict[str | None, int] = defaultdict(int)
+        self.events: list[dict] = []
+
+    def allow(self, nodeid: str | None) -> bool:
+        with self._lock:
+            return self._spent[nodeid] < self.budget
+
+    def record(self, nodeid: str | None, action: str, error: BaseException, elapsed: float) -> None:
+        with self._lock:
+            self._spent[nodeid] += 1
+            self.events.append({
+                "test": nodeid,
+                "action": action,
+                "error": type(error).__name__,
+                "elapsed_s": round(elapsed, 3),
+            })
+
+    def report(self) -> dict:
+        """Actions ranked by retry count, with the time lost to them and the affected tests."""
+        actions: dict[str, dict] = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            entry = actions.setdefault(
+                event["action"],
+                {"retries": 0, "time_s": 0.0, "errors": defaultdict(int), "tests": set()},
+            )
+            entry["retries"] += 1
+            entry["time_s"] += event["elapsed_s"]
+            entry["errors"][event["error"]] += 1
+            entry["tests"].add(event["test"])
+
+        ranked = sorted(actions.items(), key=lambda item: (item[1]["retries"], item[1]["time_s"]), reverse=True)
+        return {
+            "total_retries": len(events),
+            "total_time_s": round(sum(event["elapsed_s"] for event in events), 3),
+            "actions": [
+                {
+                    "action": action,
+                    "retries": entry["retries"],
+                    "time_s": round(entry["time_s"], 3),
+                    "errors": dict(entry["errors"]),
+                    "tests": sorted(test for test in entry["tests"] if test),
+                }
+                for action, entry in ranked
+            ],
+        }
+
+    def write(self, path: Path) -> None:
+        if not self.events:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+
+LEDGER = RetryLedger()
+
+
+def retry_step(func):
+    """Re-run a page-object action on transient errors while the test has budget left.
+
+    Cached element handles are dropped before each retry, since a stale handle
+    is the usual cause.
+    """
+    action = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(page, *args, **kwargs):
+        nodeid = current_test()
+        accounted = 0.0
+
+        def should_retry(error: BaseException) -> bool:
+            return isinstance(error, TRANSIENT_ERRORS) and LEDGER.allow(nodeid)
+
+        def before_sleep(state: RetryCallState) -> None:
+            nonlocal accounted
+            # A retry costs the failed attempt plus the pause before the next one.
+            cost = state.seconds_since_start - accounted + state.upcoming_sleep
+            accounted += cost
+            error = state.outcome.exception()
+            LEDGER.record(nodeid, action, error, cost)
+            logger.warning("Retrying %s after %s (attempt %d)", action, type(error).__name__, state.attempt_number)
+            page.elements.clear()
+
+        retrying = Retrying(
+            stop=stop_after_attempt(STEP_RETRY_ATTEMPTS),
+            wait=wait_exponential(multiplier=0.1, max=1),
+            retry=retry_if_exception(should_retry),
+            before_sleep=before_sleep,
+            reraise=True,
+        )
+        return retrying(func, page, *args, **kwargs)
+
+    return wrapper
+
+
+__all__ = ["LEDGER", "RetryLedger", "TRANSIENT_ERRORS", "retry_step"]
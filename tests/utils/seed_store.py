@@ -0,0 +1,134 @@
+"""Seed data built once per module and handed to each test as a restored copy.
+
+The first test asking for a seed builds it through the UI as before; the
+browser's localStorage and cookies are then snapshotted. Later tests in the
+module get the snapshot written into their own fresh browser instead, which
+costs one page load. After every test the seed records are compared with the
+snapshot: if the test changed or removed any of them (or is marked
+``mutates_seed``), the seed is rebuilt for the next test. Records a test only
+added are left alone, since nothing else refers to them. When the app keeps
+its data outside the browser, the comparison sees nothing and only the marker
+triggers a rebuild.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from selenium.common.exceptions import WebDriverException
+
+from ..constants import SEED_SCOPE
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.seed")
+
+MUTATES_SEED_MARKER = "mutates_seed"
+
+READ_STORAGE_SCRIPT = "return Object.assign({}, window.localStorage);"
+WRITE_STORAGE_SCRIPT = """
+window.localStorage.clear();
+for (const [key, value] of Object.entries(arguments[0])) {
+  window.localStorage.setItem(key, value);
+}
+"""
+
+
+def _collections(storage: dict[str, str]) -> dict[str, dict[str, dict]]:
+    """Records kept in storage, as ``{"key/resource": {id: record}}``.
+
+    Only values shaped like react-admin's local-storage provider
+    (``{resource: [{"id": ...}, ...]}``) count; tokens and settings do not.
+    """
+    collections: dict[str, dict[str, dict]] = {}
+    for key, raw in storage.items():
+        try:
+            value = json.loads(raw)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(value, dict):
+            continue
+        for resource, records in value.items():
+            if isinstance(records, list) and all(isinstance(record, dict) and "id" in record for record in records):
+                collections[f"{key}/{resource}"] = {str(record["id"]): record for record in records}
+    return collections
+
+
+@dataclass(slots=True)
+class SeedEntry:
+    data: dict
+    storage: dict[str, str]
+    cookies: list[dict]
+    dirty: bool = False
+    reuses: int = 0
+    records: dict[str, dict[str, dict]] = field(default_factory=dict)
+
+
+class SeedStore:
+    """Named seeds of one test module (see the module docstring)."""
+
+    def __init__(self, scope: str = SEED_SCOPE):
+        self.scope = scope
+        self._entries: dict[str, SeedEntry] = {}
+
+    @property
+    def shared(self) -> bool:
+        return self.scope == "module"
+
+    def provide(self, request, driver, name: str, seed: Callable[[], dict | None]) -> dict:
+        """Return the data of seed ``name``, building it with ``seed()`` when needed."""
+        if not self.shared:
+            return seed() or {}
+
+        entry = self._entries.get(name)
+        if entry is not None and not entry.dirty:
+            self._restore(driver, entry)
+            entry.reuses += 1
+            logger.info("Restored seed %s (reuse #%d)", name, entry.reuses)
+        else:
+            data = seed() or {}
+            entry = self._snapshot(driver, data)
+            self._entries[name] = entry
+            logger.info("Built seed %s", name)
+
+        request.addfinalizer(lambda: self._check(request, driver, name, entry))
+        return entry.data
+
+    def _snapshot(self, driver, data: dict) -> SeedEntry:
+        storage = driver.execute_script(READ_STORAGE_SCRIPT) or {}
+        return SeedEntry(
+            data=data,
+            storage=storage,
+            cookies=driver.get_cookies(),
+            records=_collections(storage),
+        )
+
+    def _restore(self, driver, entry: SeedEntry) -> None:
+        # Storage and cookies are per origin; the driver fixture leaves the browser on the app.
+        driver.execute_script(WRITE_STORAGE_SCRIPT, entry.storage)
+        for cookie in entry.cookies:
+            driver.add_cookie({key: value for key, value in cookie.items() if key != "sameSite"})
+        driver.refresh()
+
+    def _check(self, request, driver, name: str, entry: SeedEntry) -> None:
+        if request.node.get_closest_marker(MUTATES_SEED_MARKER):
+            entry.dirty = True
+        else:
+            try:
+                current = _collections(driver.execute_script(READ_STORAGE_SCRIPT) or {})
+            except WebDriverException:
+                logger.warning("Could not read storage after %s; seed %s will be rebuilt", request.node.nodeid, name)
+                entry.dirty = True
+            else:
+                entry.dirty = any(
+                    current.get(collection, {}).get(record_id) != record
+                    for collection, records in entry.records.items()
+                    for record_id, record in records.items()
+                )
+        if entry.dirty:
+            logger.info("%s changed seed %s; it will be rebuilt", request.node.nodeid, name)
+
+
+__all__ = ["MUTATES_SEED_MARKER", "SeedEntry", "SeedStore"]
@@ -0,0 +1,177 @@
+"""Bulk data seeding that bypasses the UI.
+
+Two channels are supported:
+
+* ``rest`` posts records to the app API (``APP_API_URL``) over a pooled
+  ``requests`` session, several requests in flight at once. The server
+  assigns the ids, and foreign keys are rewritten to them, so the dataset
+  never clashes with records that already exist;
+* ``storage`` writes the whole dataset into the browser's localStorage in the
+  layout used by react-admin's local-storage data provider, then reloads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.seeding")
+
+RESOURCES = ("task_statuses", "users", "labels", "tasks")
+DEFAULT_STORAGE_KEY = "ra-data-local-storage"
+FOREIGN_KEYS = {"status_id": "task_statuses", "assignee_id": "users", "label_id": "labels"}
+
+
+@dataclass(slots=True)
+class Dataset:
+    task_statuses: list[dict] = field(default_factory=list)
+    users: list[dict] = field(default_factory=list)
+    labels: list[dict] = field(default_factory=list)
+    tasks: list[dict] = field(default_factory=list)
+
+    def counts(self) -> dict[str, int]:
+        return {resource: len(getattr(self, resource)) for resource in RESOURCES}
+
+    def head(self, **limits: int) -> Dataset:
+        """Return the first N records of each resource (all of them when not limited)."""
+        return Dataset(**{
+            resource: getattr(self, resource)[: limits.get(resource, len(getattr(self, resource)))]
+            for resource in RESOURCES
+        })
+
+
+def generate_dataset(
+    *,
+    statuses: int = 50,
+    users: int = 2000,
+    labels: int = 20,
+    tasks: int = 10000,
+    prefix: str = "Scale",
+    seed: int = 0,
+) -> Dataset:
+    """Build deterministic records whose ids can be used as foreign keys directly.
+
+    Task N only references statuses, users and labels among the first N/tasks
+    share of them, so slicing every resource by the same fraction keeps
+    references valid.
+    """
+    rng = random.Random(seed)
+    slug = prefix.lower()
+    dataset = Dataset(
+        task_statuses=[
+            {"id": index, "name": f"{prefix} status {index}", "slug": f"{slug}-status-{index}"}
+            for index in range(1, statuses + 1)
+        ],
+        users=[
+            {
+                "id": index,
+                "email": f"{slug}_user_{index}@example.com",
+                "firstName": f"{prefix}{index}",
+                "lastName": "User",
+            }
+            for index in range(1, users + 1)
+        ],
+        labels=[
+            {"id": index, "name": f"{prefix}_label_{index}"} for index in range(1, labels + 1)
+        ],
+    )
+    for index in range(1, tasks + 1):
+        # Spread tasks so that early ids only reference early statuses/users/labels.
+        ceiling = max(1, index * statuses // max(tasks, 1))
+        dataset.tasks.append({
+            "id": index,
+            "title": f"{prefix}_task_{index}",
+            "content": f"Generated task {index}",
+            "status_id": rng.randint(1, ceiling) if statuses else None,
+            "assignee_id": rng.randint(1, max(1, index * users // max(tasks, 1))) if users else None,
+            "label_id": [rng.randint(1, max(1, index * labels // max(tasks, 1)))] if labels else [],
+        })
+    return dataset
+
+
+class RestSeedChannel:
+    def __init__(self, api_url: str, *, concurrency: int = 8, timeout: float = 10.0):
+        self.api_url = api_url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Dataset id -> server id per resource, for every record this channel created.
+        self.ids: dict[str, dict[int, int]] = {resource: {} for resource in RESOURCES}
+
+    def _payload(self, record: dict) -> dict:
+        payload = {}
+        for key, value in record.items():
+            if key == "id":
+                continue
+            target = FOREIGN_KEYS.get(key)
+            if target is None or value is None:
+                payload[key] = value
+            elif isinstance(value, list):
+                payload[key] = [self.ids[target][item] for item in value]
+            else:
+                payload[key] = self.ids[target][value]
+        return payload
+
+    def _post(self, resource: str, record: dict) -> None:
+        response = self.session.post(
+            f"{self.api_url}/{resource}",
+            json=self._payload(record),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        self.ids[resource][record["id"]] = response.json()["id"]
+
+    def load(self, dataset: Dataset) -> None:
+        """Create the records of ``dataset`` that this channel has not created yet."""
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            # Resources go in dependency order; records within one resource in parallel.
+            for resource in RESOURCES:
+                created = self.ids[resource]
+                records = [record for record in getattr(dataset, resource) if record["id"] not in created]
+                list(pool.map(lambda record, name=resource: self._post(name, record), records))
+                logger.info("Seeded %d %s over REST", len(records), resource)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class StorageSeedChannel:
+    def __init__(self, driver, key: str = DEFAULT_STORAGE_KEY):
+        self.driver = driver
+        self.key = key
+
+    def load(self, dataset: Dataset) -> None:
+        # localStorage is replaced wholesale, with the dataset's own ids.
+        payload = json.dumps({resource: getattr(dataset, resource) for resource in RESOURCES})
+        self.driver.execute_script(
+            "window.localStorage.setItem(arguments[0], arguments[1]);",
+            self.key,
+            payload,
+        )
+        self.driver.refresh()
+        logger.info("Seeded %s into localStorage[%s]", dataset.counts(), self.key)
+
+    def close(self) -> None:
+        pass
+
+
+__all__ = [
+    "DEFAULT_STORAGE_KEY",
+    "FOREIGN_KEYS",
+    "Dataset",
+    "RESOURCES",
+    "RestSeedChannel",
+    "StorageSeedChannel",
+    "generate_dataset",
+]
@@ -0,0 +1,181 @@
+"""Pick the most valuable tests that fit a wall-clock budget (``pytest --smoke-budget 60``).
+
+Every test belongs to the area its module covers. Its cost is the median
+duration of its recent runs (setup and teardown included, so browser start and
+seeding count); tests without history get the median of the known costs. Its
+value grows with its recent failure rate, since a test that has been failing
+says more about a deploy than one that always passes.
+
+The plan first takes the best test per area, by value per second, whether or
+not it fits, then fills the rest of the budget greedily by value per second.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..constants import RUN_HISTORY_FILE, SMOKE_DEFAULT_COST
+
+AREAS = ("auth", "users", "statuses", "labels", "tasks")
+MAX_RUNS = 20
+FAILURE_WEIGHT = 4.0
+
+
+def area_of(nodeid: str) -> str:
+    module = nodeid.split("::", 1)[0].rsplit("/", 1)[-1].removesuffix(".py")
+    area = module.removeprefix("test_")
+    return area if area in AREAS else "other"
+
+
+class RunHistory:
+    """Recent durations and outcomes per test, persisted between runs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._runs: dict[str, list[list]] | None = None
+        self._new: dict[str, list[list]] = {}
+
+    def _history(self) -> dict[str, list[list]]:
+        if self._runs is None:
+            try:
+                self._runs = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._runs = {}
+        return self._runs
+
+    def record(self, nodeid: str, duration: float, *, failed: bool) -> None:
+        run = [round(duration, 2), failed]
+        with self._lock:
+            self._new.setdefault(nodeid, []).append(run)
+
+    def cost(self, nodeid: str) -> float | None:
+        runs = self._history().get(nodeid)
+        return statistics.median(duration for duration, _ in runs) if runs else None
+
+    def failure_rate(self, nodeid: str) -> float:
+        runs = self._history().get(nodeid)
+        return sum(failed for _, failed in runs) / len(runs) if runs else 0.0
+
+    def _pending_path(self, worker: str) -> Path:
+        return self.path.with_name(f"{self.path.stem}-{worker}{self.path.suffix}")
+
+    def save(self, worker: str = "main") -> None:
+        """Store this process's runs without racing other processes for the store.
+
+        An xdist worker writes its runs to a file of its own; the controller
+        (``main``) merges those files and its own runs into the store.
+        """
+        with self._lock:
+            new, self._new = self._new, {}
+        if worker != "main":
+            if new:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._pending_path(worker).write_text(json.dumps(new), encoding="utf-8")
+            return
+
+        batches = [new]
+        for path in sorted(self.path.parent.glob(self._pending_path("*").name)):
+            try:
+                batches.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                pass
+            path.unlink(missing_ok=True)
+        if not any(batches):
+            return
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stored = {}
+        for batch in batches:
+            for nodeid, runs in batch.items():
+                merged = stored.setdefault(nodeid, [])
+                merged.extend(runs)
+                del merged[:-MAX_RUNS]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(stored, indent=1, sort_keys=True), encoding="utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    nodeid: str
+    area: str
+    cost: float
+    value: float
+    known: bool
+
+    @property
+    def density(self) -> float:
+        return self.value / max(self.cost, 0.01)
+
+
+@dataclass(frozen=True, slots=True)
+class SmokePlan:
+    budget: float
+    selected: list[Candidate]
+    dropped: list[Candidate]
+
+    @property
+    def predicted(self) -> float:
+        return sum(candidate.cost for candidate in self.selected)
+
+    def format(self) -> list[str]:
+        lines = [
+            f"{len(self.selected)} of {len(self.selected) + len(self.dropped)} tests, "
+            f"predicted {self.predicted:.1f}s of a {self.budget:.0f}s budget (serial)",
+        ]
+        for candidate in self.selected:
+            estimate = "" if candidate.known else " (no history)"
+            lines.append(
+                f"  {candidate.cost:7.1f}s  value {candidate.value:4.1f}  {candidate.area:<9}{candidate.nodeid}{estimate}",
+            )
+        return lines
+
+
+def candidates(nodeids: list[str], history: RunHistory) -> list[Candidate]:
+    known = [cost for cost in map(history.cost, nodeids) if cost is not None]
+    fallback = statistics.median(known) if known else SMOKE_DEFAULT_COST
+    result = []
+    for nodeid in nodeids:
+        cost = history.cost(nodeid)
+        result.append(
+            Candidate(
+                nodeid=nodeid,
+                area=area_of(nodeid),
+                cost=cost if cost is not None else fallback,
+                value=1.0 + FAILURE_WEIGHT * history.failure_rate(nodeid),
+                known=cost is not None,
+            ),
+        )
+    return result
+
+
+def plan(pool: list[Candidate], budget: float) -> SmokePlan:
+    chosen: set[str] = set()
+    for area in AREAS:
+        in_area = [candidate for candidate in pool if candidate.area == area]
+        if in_area:
+            chosen.add(max(in_area, key=lambda candidate: candidate.density).nodeid)
+
+    remaining = budget - sum(candidate.cost for candidate in pool if candidate.nodeid in chosen)
+    for candidate in sorted(pool, key=lambda candidate: candidate.density, reverse=True):
+        if candidate.nodeid not in chosen and candidate.cost <= remaining:
+            chosen.add(candidate.nodeid)
+            remaining -= candidate.cost
+
+    # Collection order is kept, so module fixtures and seeds are still shared.
+    return SmokePlan(
+        budget=budget,
+        selected=[candidate for candidate in pool if candidate.nodeid in chosen],
+        dropped=[candidate for candidate in pool if candidate.nodeid not in chosen],
+    )
+
+
+HISTORY = RunHistory(Path(RUN_HISTORY_FILE).resolve())
+
+
+__all__ = ["AREAS", "HISTORY", "Candidate", "RunHistory", "SmokePlan", "area_of", "candidates", "plan"]
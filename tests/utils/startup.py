@@ -0,0 +1,172 @@
+"""Import and collection time of a pytest session (``pytest --startup-profile``).
+
+The root conftest lists this plugin in ``pytest_plugins``, so the flag works
+in any run, but by then the conftest has been imported and only test modules
+are timed. Loading it with ``-p tests.utils.startup`` (``make startup-profile``)
+registers it before the initial conftests, which are then timed as well.
+
+A meta path finder times every module executed until collection finishes and
+keeps each module's self time, without the nested imports it triggered.
+Loading the initial conftests and collecting each test module are timed as a
+whole, with the share spent in imports shown separately.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+
+class _TimedLoader:
+    def __init__(self, loader, profile: StartupProfile):
+        self._loader = loader
+        self._profile = profile
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        with self._profile.importing(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, profile: StartupProfile):
+        self._profile = profile
+
+    def find_spec(self, name, path, target=None):
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profile)
+        return spec
+
+
+class StartupProfile:
+    def __init__(self):
+        self.enabled = False
+        self.imports: dict[str, float] = {}
+        self.modules: dict[str, dict[str, float]] = {}
+        self._finder = _TimingFinder(self)
+        self._stack: list[float] = []
+        self._phase: str | None = None
+
+    def start(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def importing(self, name: str):
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.imports[name] = elapsed - self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            elif self._phase is not None:
+                self.modules[self._phase]["imports"] += elapsed
+
+    @contextmanager
+    def phase(self, name: str):
+        self._phase = name
+        self.modules[name] = {"total": 0.0, "imports": 0.0}
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.modules[name]["total"] = time.perf_counter() - started
+            self._phase = None
+
+    def format(self, limit: int = 15) -> list[str]:
+        total = sum(module["total"] for module in self.modules.values())
+        lines = [f"{total:.3f}s in conftests and test modules, {len(self.imports)} modules imported"]
+        if self.imports:
+            lines.append(f"slowest imports (self time, top {limit}):")
+            slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:limit]
+            lines += [f"  {seconds:8.3f}s  {name}" for name, seconds in slowest]
+        if self.modules:
+            lines.append("loading per conftest phase and test module:")
+            ranked = sorted(self.modules.items(), key=lambda item: item[1]["total"], reverse=True)
+            lines += [
+                f"  {module['total']:8.3f}s  (imports {module['imports']:.3f}s)  {name}"
+                for name, module in ranked
+            ]
+        return lines
+
+
+PROFILE = StartupProfile()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--startup-profile",
+        action="store_true",
+        default=False,
+        help="report import and collection time per module",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_load_initial_conftests(early_config: pytest.Config, parser: pytest.Parser, args: list[str]):
+    if not early_config.known_args_namespace.startup_profile:
+        yield
+        return
+    PROFILE.start()
+    with PROFILE.phase("initial conftests"):
+        yield
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if config.getoption("startup_profile"):
+        # Registered through pytest_plugins: the initial conftests are already loaded.
+        PROFILE.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector: pytest.Collector):
+    if not PROFILE.enabled or not isinstance(collector, pytest.Module):
+        yield
+        return
+    with PROFILE.phase(collector.nodeid):
+        yield
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    PROFILE.stop()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    if not PROFILE.enabled:
+        return
+    terminalreporter.section("startup profile")
+    for line in PROFILE.format():
+        terminalreporter.write_line(line)
+
+
+__all__ = ["PROFILE", "StartupProfile"]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from ..constants import (
+    ADAPTIVE_MIN_MARGIN,
+    ADAPTIVE_MIN_SAMPLES,
+    ADAPTIVE_PERCENTILE,
+    ADAPTIVE_TIMEOUTS,
+    WAIT_HISTORY_FILE,
+)
+
+MAX_SAMPLES = 200
+
+
+class TimeoutHistory:
+    """Observed durations of ``Wait.probe`` checks, persisted between runs.
+
+    A probe gets ``percentile + max(min_margin, percentile / 2)`` as its
+    timeout once enough samples exist, never more than its static timeout.
+    Only successful waits are recorded, so a check that usually answers "no"
+    is bounded by how long a "yes" has historically taken.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        percentile: float = ADAPTIVE_PERCENTILE,
+        min_samples: int = ADAPTIVE_MIN_SAMPLES,
+        min_margin: float = ADAPTIVE_MIN_MARGIN,
+        enabled: bool = ADAPTIVE_TIMEOUTS,
+    ):
+        self.path = path
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_margin = min_margin
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[float]] | None = None
+        self._new: dict[str, list[float]] = {}
+
+    def _history(self) -> dict[str, list[float]]:
+        if self._samples is None:
+            try:
+                self._samples = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._samples = {}
+        return self._samples
+
+    def record(self, name: str, elapsed: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._history().setdefault(name, [])
+            samples.append(round(elapsed, 3))
+            del samples[:-MAX_SAMPLES]
+            self._new.setdefault(name, []).append(round(elapsed, 3))
+
+    def timeout_for(self, name: str, cap: float) -> float:
+        if not self.enabled:
+            return cap
+        with self._lock:
+            samples = sorted(self._history().get(name, ()))
+        if len(samples) < self.min_samples:
+            return cap
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        observed = samples[index]
+        return min(cap, observed + max(self.min_margin, observed / 2))
+
+    def save(self) -> None:
+        """Merge this process's samples into the store (other workers may have saved too)."""
+        if not self.enabled or not self._new:
+            return
+        with self._lock:
+            try:
+                stored = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                stored = {}
+            for name, values in self._new.items():
+                merged = stored.setdefault(name, [])
+                merged.extend(values)
+                del merged[:-MAX_SAMPLES]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(stored, indent=1), encoding="utf-8")
+            self._new = {}
+
+
+HISTORY = TimeoutHistory(Path(WAIT_HISTORY_FILE).resolve())
+
+
+__all__ = ["HISTORY", "TimeoutHistory"]
@@ -0,0 +1,171 @@
+"""Trace-event timeline of a test session (``chrome://tracing``, Perfetto).
+
+Spans are stored as complete (``"ph": "X"``) events. Each xdist worker is one
+track, and spans on a track nest by time: test, phase, fixture, page-object
+method, wait and WebDriver command. Workers write their own file; the
+controlling process merges them into ``trace.json``.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from .commands import CommandEvent
+
+PROCESS_ID = 1
+# perf_counter for durations, wall clock for the origin, so workers line up.
+_EPOCH = time.time() - time.perf_counter()
+
+
+def _now_us() -> float:
+    return (_EPOCH + time.perf_counter()) * 1_000_000
+
+
+def worker_track(worker: str) -> int:
+    match = re.fullmatch(r"gw(\d+)", worker)
+    return int(match.group(1)) + 1 if match else 0
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.track = 0
+        self.track_name = "main"
+        self._lock = threading.Lock()
+        self.events: list[dict] = []
+
+    def start(self, worker: str) -> None:
+        self.enabled = True
+        self.track = worker_track(worker)
+        self.track_name = worker
+
+    def complete(self, name: str, category: str, start_us: float, duration_us: float, args: dict | None = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(start_us, 1),
+            "dur": round(duration_us, 1),
+            "pid": PROCESS_ID,
+            "tid": self.track,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        if not self.enabled:
+            yield
+            return
+        started = _now_us()
+        try:
+            yield
+        finally:
+            self.complete(name, category, started, _now_us() - started, args)
+
+    @contextmanager
+    def fixture(self, fixturedef):
+        """Span a fixture's setup and arrange one for its teardown.
+
+        Finalizers run last-in first-out, so one added before the fixture
+        function runs fires after its teardown, and one added after fires
+        before it.
+        """
+        if not self.enabled:
+            yield
+            return
+        name = fixturedef.argname
+        teardown: dict[str, float] = {}
+
+        def teardown_finished() -> None:
+            if "start" in teardown:
+                self.complete(f"teardown {name}", "fixture", teardown["start"], _now_us() - teardown["start"])
+
+        fixturedef.addfinalizer(teardown_finished)
+        with self.span(f"setup {name}", "fixture", scope=fixturedef.scope):
+            yield
+        fixturedef.addfinalizer(lambda: teardown.setdefault("start", _now_us()))
+
+    def on_command(self, event: CommandEvent) -> None:
+        """``add_command_listener`` callback: one span per WebDriver command."""
+        if not self.enabled:
+            return
+        args = {"error": type(event.error).__name__} if event.error else None
+        duration_us = event.duration * 1_000_000
+        # Listeners run right after the command returns; anchor on our own clock.
+        self.complete(event.command, "webdriver", _now_us() - duration_us, duration_us, args)
+
+    def write(self, path: Path) -> None:
+        if not self.enabled:
+            return
+        metadata = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": PROCESS_ID,
+            "tid": self.track,
+            "args": {"name": self.track_name},
+        }
+        with self._lock:
+            events = [metadata, *self.events]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": events}), encoding="utf-8")
+
+
+def merge_traces(paths: list[Path], target: Path) -> None:
+    events: list[dict] = []
+    for path in paths:
+        try:
+            events.extend(json.loads(path.read_text(encoding="utf-8"))["traceEvents"])
+        except (OSError, ValueError, KeyError):
+            continue
+        path.unlink(missing_ok=True)
+    target.write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+        encoding="utf-8",
+    )
+
+
+TRACER = Tracer()
+
+
+def traced(category: str, name: str):
+    """Decorate a function so each call becomes a span while tracing is on."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def traced_methods(category: str):
+    """Class decorator tracing every public method the class defines itself."""
+
+    def decorator(cls):
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            if inspect.isgeneratorfunction(member):
+                continue
+            setattr(cls, name, traced(category, f"{cls.__name__}.{name}")(member))
+        return cls
+
+    return decorator
+
+
+__all__ = ["TRACER", "Tracer", "merge_traces", "traced", "traced_methods", "worker_track"]
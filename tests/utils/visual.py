@@ -0,0 +1,139 @@
+"""Screenshot comparison against stored baselines.
+
+NumPy and Pillow are optional: they are imported on the first comparison, so
+suites that never call ``assert_looks_like`` do not need them
+(``uv sync --group visual``).
+
+A check decodes the screenshot once and first compares a digest of its
+pixels with the baseline's; an unchanged screenshot passes without a pixel
+diff. Otherwise the images are diffed as arrays and pixels whose channels all
+differ by at most ``tolerance`` are masked out; the check fails when more than
+``max_ratio`` of the pixels remain. Decoded baselines and their digests stay in
+an LRU cache for the session.
+
+A missing baseline is stored from the screenshot, except in CI (``CI`` is set),
+where the check fails instead of passing against nothing.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..constants import (
+    CI,
+    VISUAL_ARTIFACTS_DIR,
+    VISUAL_BASELINE_DIR,
+    VISUAL_CACHE_SIZE,
+    VISUAL_MAX_DIFF_RATIO,
+    VISUAL_TOLERANCE,
+    VISUAL_UPDATE,
+)
+from .logging import LOGGER_NAME
+
+logger = logging.getLogger(f"{LOGGER_NAME}.visual")
+
+
+class VisualMismatchError(AssertionError):
+    pass
+
+
+def _imaging():
+    try:
+        import numpy
+        from PIL import Image
+    except ImportError as error:
+        raise RuntimeError("Visual checks need numpy and pillow: uv sync --group visual") from error
+    return numpy, Image
+
+
+def _decode(png: bytes):
+    numpy, image_module = _imaging()
+    image = image_module.open(io.BytesIO(png)).convert("RGB")
+    # An exact digest, not a perceptual hash: those match e.g. any two flat
+    # colours or a changed label, and a match here skips the pixel diff.
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+    return numpy.asarray(image, dtype=numpy.int16), digest
+
+
+@functools.lru_cache(maxsize=VISUAL_CACHE_SIZE)
+def _baseline(path: str, mtime_ns: int):
+    # The modification time is part of the key, so an updated baseline is decoded again.
+    return _decode(Path(path).read_bytes())
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    matched: bool
+    diff_ratio: float
+    prefiltered: bool
+
+
+def compare(
+    png: bytes,
+    baseline_path: Path,
+    *,
+    tolerance: int = VISUAL_TOLERANCE,
+    max_ratio: float = VISUAL_MAX_DIFF_RATIO,
+    diff_path: Path | None = None,
+) -> Comparison:
+    numpy, image_module = _imaging()
+    expected, expected_digest = _baseline(str(baseline_path), baseline_path.stat().st_mtime_ns)
+    actual, actual_digest = _decode(png)
+
+    if actual.shape != expected.shape:
+        return Comparison(matched=False, diff_ratio=1.0, prefiltered=True)
+    if actual_digest == expected_digest:
+        return Comparison(matched=True, diff_ratio=0.0, prefiltered=True)
+
+    changed = (numpy.abs(actual - expected) > tolerance).any(axis=2)
+    ratio = float(changed.mean())
+    matched = ratio <= max_ratio
+    if not matched and diff_path is not None:
+        highlight = expected.astype(numpy.uint8) // 3
+        highlight[changed] = (255, 0, 0)
+        diff_path.parent.mkdir(parents=True, exist_ok=True)
+        image_module.fromarray(highlight).save(diff_path)
+    return Comparison(matched=matched, diff_ratio=ratio, prefiltered=False)
+
+
+def check(
+    name: str,
+    png: bytes,
+    *,
+    baseline_dir: Path = Path(VISUAL_BASELINE_DIR),
+    artifacts_dir: Path = Path(VISUAL_ARTIFACTS_DIR),
+) -> Comparison:
+    """Compare ``png`` with baseline ``name``; store it as the baseline when missing or updating."""
+    baseline_path = baseline_dir / f"{name}.png"
+    if CI and not VISUAL_UPDATE and not baseline_path.exists():
+        actual_path = artifacts_dir / f"{name}.actual.png"
+        actual_path.parent.mkdir(parents=True, exist_ok=True)
+        actual_path.write_bytes(png)
+        raise VisualMismatchError(
+            f"No baseline {baseline_path} for '{name}'; commit {actual_path} as the baseline "
+            "or run with VISUAL_UPDATE=true",
+        )
+    if VISUAL_UPDATE or not baseline_path.exists():
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_bytes(png)
+        logger.warning("Stored visual baseline %s", baseline_path)
+        return Comparison(matched=True, diff_ratio=0.0, prefiltered=False)
+
+    result = compare(png, baseline_path, diff_path=artifacts_dir / f"{name}.diff.png")
+    if not result.matched:
+        actual_path = artifacts_dir / f"{name}.actual.png"
+        actual_path.parent.mkdir(parents=True, exist_ok=True)
+        actual_path.write_bytes(png)
+        raise VisualMismatchError(
+            f"'{name}' differs from {baseline_path} in {result.diff_ratio:.2%} of pixels "
+            f"(allowed {VISUAL_MAX_DIFF_RATIO:.2%}); see {actual_path}",
+        )
+    return result
+
+
+__all__ = ["Comparison", "VisualMismatchError", "check", "compare"]
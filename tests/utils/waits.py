@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from ..constants import DEFAULT_TIMEOUT, POLL_INTERVAL
+from .timeouts import HISTORY, TimeoutHistory
+from .tracing import TRACER
+
+INITIAL_POLL = 0.05
+BACKOFF = 2.0
+
+
+def condition_name(condition: Callable) -> str:
+    """Name a condition for metrics: ``visibility_of_element_located`` rather than ``_predicate``."""
+    name = getattr(condition, "wait_name", None)
+    if name:
+        return name
+    qualname = getattr(condition, "__qualname__", None) or type(condition).__name__
+    return qualname.split(".<locals>", 1)[0]
+
+
+def any_of(*conditions: Callable) -> Callable:
+    """Satisfied by the first condition that returns a truthy value."""
+
+    def condition(driver):
+        for candidate in conditions:
+            try:
+                value = candidate(driver)
+            except NoSuchElementException:
+                continue
+            if value:
+                return value
+        return False
+
+    condition.wait_name = f"any_of({', '.join(map(condition_name, conditions))})"
+    return condition
+
+
+def all_of(*conditions: Callable) -> Callable:
+    """Satisfied when every condition holds; returns their values as a list."""
+
+    def condition(driver):
+        values = []
+        for candidate in conditions:
+            value = candidate(driver)
+            if not value:
+                return False
+            values.append(value)
+        return values
+
+    condition.wait_name = f"all_of({', '.join(map(condition_name, conditions))})"
+    return condition
+
+
+class WaitStats:
+    """Time spent waiting, aggregated per condition type across the session."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: dict[str, dict[str, float]] = {}
+
+    def record(self, name: str, elapsed: float, *, timed_out: bool) -> None:
+        with self._lock:
+            entry = self.totals.setdefault(
+                name,
+                {"count": 0, "timeouts": 0, "total_s": 0.0, "max_s": 0.0},
+            )
+            entry["count"] += 1
+            entry["timeouts"] += int(timed_out)
+            entry["total_s"] += elapsed
+            entry["max_s"] = max(entry["max_s"], elapsed)
+
+    def ranked(self) -> list[tuple[str, dict[str, float]]]:
+        with self._lock:
+            return sorted(self.totals.items(), key=lambda item: item[1]["total_s"], reverse=True)
+
+
+STATS = WaitStats()
+
+
+class Wait:
+    """Drop-in for ``WebDriverWait`` with backoff polling.
+
+    Polling starts at ``INITIAL_POLL`` and doubles up to ``POLL_INTERVAL``, so
+    fast conditions return quickly without hammering the driver on slow ones.
+    Browsers run with an implicit wait of zero (see ``new_browser``), so an
+    empty ``find_elements`` inside a condition returns at once.
+
+    ``probe`` is for checks whose "no" is an expected answer: it gives up
+    after the time its "yes" answers have historically taken.
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeout: float = DEFAULT_TIMEOUT,
+        *,
+        max_poll: float = POLL_INTERVAL,
+        ignored_exceptions: tuple[type[Exception], ...] = (NoSuchElementException,),
+        stats: WaitStats = STATS,
+        history: TimeoutHistory = HISTORY,
+    ):
+        self.driver = driver
+        self.timeout = timeout
+        self.max_poll = max_poll
+        self.ignored_exceptions = ignored_exceptions
+        self.stats = stats
+        self.history = history
+
+    def until(
+        self,
+        method: Callable,
+        message: str = "",
+        *,
+        timeout: float | None = None,
+        name: str | None = None,
+    ):
+        return self._poll(method, message, timeout, name, negate=False)
+
+    def until_not(
+        self,
+        method: Callable,
+        message: str = "",
+        *,
+        timeout: float | None = None,
+        name: str | None = None,
+    ):
+        return self._poll(method, message, timeout, name, negate=True)
+
+    def probe(self, method: Callable, *, name: str, negate: bool = False) -> bool:
+        """Answer an expected-negative check, bounded by the history of ``name``.
+
+        Only "yes" answers are recorded, so a "no" returns after about the time
+        a "yes" has taken instead of after the full static timeout.
+        """
+        timeout = self.history.timeout_for(name, self.timeout)
+        try:
+            self._poll(method, "", timeout, name, negate=negate, history_key=name)
+        except TimeoutException:
+            return False
+        return True
+
+    def _poll(self, method, message, timeout, name, *, negate: bool, history_key: str | None = None):
+        timeout = self.timeout if timeout is None else timeout
+        name = name or condition_name(method)
+        started = time.monotonic()
+        deadline = started + timeout
+        delay = INITIAL_POLL
+        timed_out = False
+        try:
+            with TRACER.span(f"wait {name}", "wait", timeout=timeout):
+                while True:
+                    try:
+                        value = method(self.driver)
+                    except self.ignored_exceptions:
+                        if negate:
+                            value = True
+                            break
+                        value = None
+                    else:
+                        if bool(value) != negate:
+                            break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        timed_out = True
+                        raise TimeoutException(message or f"Timed out after {timeout}s waiting for {name}")
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * BACKOFF, self.max_poll)
+            if history_key:
+                self.history.record(history_key, time.monotonic() - started)
+            return value
+        finally:
+            self.stats.record(name, time.monotonic() - started, timed_out=timed_out)
+
+
+__all__ = ["STATS", "Wait", "WaitStats", "all_of", "any_of", "condition_name"]